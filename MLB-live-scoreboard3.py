@@ -1,8 +1,6 @@
 import datetime
 import config
 import sys
-import time
-import os
 import re
 import textwrap
 import argparse
@@ -11,6 +9,9 @@ import keyboard
 
 import mlb_api
 import scoreboard_data
+import feed_replay
+import scoreboard_frame
+import scoreboard_grid
 
 """
 JSON viewer
@@ -68,10 +69,16 @@ class MLBLiveScoreboard:
     delay_refresh_rate = 60
     game_note = ''
     game_status = ''
-
-    def __init__(self):
-        self.api = mlb_api.MLB_API()
-        self.scoreboard_data = scoreboard_data.ScoreboardData()
+    clock = None
+    frame = None
+    printed_frame = None
+    printer = None
+
+    def __init__(self, api=None, clock=None):
+        self.api = api if api is not None else mlb_api.MLB_API()
+        self.clock = clock if clock is not None else feed_replay.Clock()
+        self.printer = scoreboard_frame.TerminalPrinter()
+        self.scoreboard_data = scoreboard_data.ScoreboardData(self.api)
         self.refresh_rate = int(config.SB_CONFIG['refresh'])
         self.delay_refresh_rate = int(config.SB_CONFIG['delay'])
 
@@ -223,14 +230,6 @@ class MLBLiveScoreboard:
         # return away and home team RHE as lists
         return away_team_rhe, home_team_rhe
 
-    @staticmethod
-    def clear_screen():
-        # Try to clear the screen between each redraw of scoreboard
-        if os.name.upper() == 'NT':
-            os.system('cls')
-        else:
-            print('\n\n\n\n')
-
     @staticmethod
     def format_due_up_status(commentary, due_up_batters, sb_width):
         """
@@ -271,40 +270,7 @@ class MLBLiveScoreboard:
         :return:
         """
         # stats:  wins, losses, era
-        stats = ['0', '0', '-.--']
-        found = False
-
-        pitcher_stats = self.get_boxscore_data()
-
-        # away
-        for pitcher in pitcher_stats['teams']['away']['players']:
-            if 'ID' + str(pitcher_id) == pitcher:
-                stats[2] = pitcher_stats['teams']['away']['players']['ID' + str(pitcher_id)]['seasonStats']['pitching'][
-                    'era']
-                stats[0] = pitcher_stats['teams']['away']['players']['ID' + str(pitcher_id)]['seasonStats']['pitching'][
-                    'wins']
-                stats[1] = pitcher_stats['teams']['away']['players']['ID' + str(pitcher_id)]['seasonStats']['pitching'][
-                    'losses']
-                found = True
-                break
-
-        # home
-        if not found:
-            for pitcher in pitcher_stats['teams']['home']['players']:
-                if 'ID' + str(pitcher_id) == pitcher:
-                    stats[2] = \
-                        pitcher_stats['teams']['home']['players']['ID' + str(pitcher_id)]['seasonStats']['pitching'][
-                            'era']
-                    stats[0] = \
-                        pitcher_stats['teams']['home']['players']['ID' + str(pitcher_id)]['seasonStats']['pitching'][
-                            'wins']
-                    stats[1] = \
-                        pitcher_stats['teams']['home']['players']['ID' + str(pitcher_id)]['seasonStats']['pitching'][
-                            'losses']
-                    found = True
-                    break
-
-        return stats
+        return self.scoreboard_data.return_pitcher_stats(pitcher_id)
 
     def build_sched_pitchers_line(self):
         """
@@ -434,213 +400,171 @@ class MLBLiveScoreboard:
         #     batter_stats = self.get_batter_stats(batter_id, 'home')
         batter_stats = self.get_batter_stats(batter_id)
         pitcher_stats = self.get_pitcher_stats(pitcher_id)
+        pitch_count = self.scoreboard_data.return_pitch_count(pitcher_id)
 
         # return pitcher-batter matchup line
-        return 'Pitcher: {} ({} ERA) \n            | Batter : {} ({}-{}, {} AVG)'.format(pitcher_name, pitcher_stats[2],
+        return 'Pitcher: {} ({} ERA, {} P) \n            | Batter : {} ({}-{}, {} AVG)'.format(pitcher_name,
+                                                                                         pitcher_stats[2],
+                                                                                         pitch_count,
                                                                                          batter_name,
                                                                                          batter_stats[1],
                                                                                          batter_stats[2],
                                                                                          batter_stats[3])
 
-    def run(self):
-
-        try:
-            # loop until the game is over
-            end_loop = False
-            while not end_loop:
-
-                self.clear_screen()
-
-                # Init vars for redraw
-                scoreboard_title = ''
-                scoreboard_inning_headers = []
-                away_line_score = []
-                home_line_score = []
-                scoreboard_totals_headers = ['R', 'H', 'E']
-                away_totals = ['0', '0', '0']
-                home_totals = ['0', '0', '0']
-
-                # print update header
-                print('Retrieving game data from MLB ({})...\n'.format(datetime.datetime.now().strftime('%m/%d/%Y %X')))
-
-                # get updated data from MLB
-                self.livedata = self.refresh_live_data()
+    def build_frame(self, stale_since=None):
+        """
+        Return the scoreboard frame for the current snapshot.  Frames are
+        kept by snapshot version, so an unchanged game gives back the frame
+        already built.
 
-                # get game status
-                self.game_status = self.get_game_status()
+        :param stale_since: when MLB stopped answering, or None
+        :return:
+        """
+        snapshot = self.scoreboard_data.return_snapshot()
+        if self.frame is not None and self.frame.version == snapshot.version and \
+                self.frame.stale_since == stale_since:
+            return self.frame
+
+        # Init vars for redraw
+        scoreboard_inning_headers = []
+        away_line_score = []
+        home_line_score = []
+        scoreboard_totals_headers = ['R', 'H', 'E']
+        away_totals = ['0', '0', '0']
+        home_totals = ['0', '0', '0']
 
-                # Load team totals
-                if self.game_status.upper() not in GAME_STATUS_NOT_STARTED:
-                    away_totals, home_totals = self.get_team_rhe()
+        # get game status
+        self.game_status = self.get_game_status()
 
-                # Get game note
-                self.game_note = self.get_game_note()
+        # Load team totals
+        if self.game_status.upper() not in GAME_STATUS_NOT_STARTED:
+            away_totals, home_totals = self.get_team_rhe()
 
-                # Add team names and records to line scores
-                away_line_score, home_line_score = self.build_team_names_with_record(away_line_score, home_line_score)
+        # Get game note
+        self.game_note = self.get_game_note()
 
-                # Enter inning half or game status in first element of inning header
-                team_name_length = max(len(away_line_score[0]), len(home_line_score[0]))
+        # Add team names and records to line scores
+        away_line_score, home_line_score = self.build_team_names_with_record(away_line_score, home_line_score)
 
-                if self.game_status.upper() != 'IN PROGRESS' and self.game_status[
-                                                                 :7].upper() != 'DELAYED' and self.game_status[
-                                                                                              :9].upper() != 'SUSPENDED':
-                    inning_half = ' '
-                else:
-                    inning_half = '{} {}'.format(self.get_current_inning_half(), self.get_current_inning())
+        # Enter inning half or game status in first element of inning header
+        team_name_length = max(len(away_line_score[0]), len(home_line_score[0]))
 
-                if team_name_length > len(inning_half):
-                    inning_half += ' ' * (team_name_length - len(inning_half))
+        if self.game_status.upper() != 'IN PROGRESS' and self.game_status[
+                                                         :7].upper() != 'DELAYED' and self.game_status[
+                                                                                      :9].upper() != 'SUSPENDED':
+            inning_half = ' '
+        else:
+            inning_half = '{} {}'.format(self.get_current_inning_half(), self.get_current_inning())
+
+        if team_name_length > len(inning_half):
+            inning_half += ' ' * (team_name_length - len(inning_half))
+
+        # inning headers
+        scoreboard_inning_headers.append(inning_half.upper())
+
+        # fill innings
+        scoreboard_inning_headers, \
+        away_line_score, home_line_score = self.build_innings(scoreboard_inning_headers, away_line_score,
+                                                              home_line_score)
+        # Append team totals to line scores
+        scoreboard_inning_headers += scoreboard_totals_headers
+        away_line_score += away_totals
+        home_line_score += home_totals
+
+        # any other not 'in progress' state
+        game_status_info = ''
+        if self.game_status not in GAME_STATUS_RUNNING:
+            sb_width = scoreboard_frame.scoreboard_width(scoreboard_inning_headers)
+            game_status_info = self.build_game_status_info(sb_width).strip('\n')
+
+        updated = ''
+        if snapshot.last_update is not None:
+            updated = snapshot.last_update.strftime('%m/%d/%Y %X')
+
+        self.frame = scoreboard_frame.Frame(version=snapshot.version,
+                                            game_pk=self.game_pk,
+                                            game_status=self.game_status,
+                                            updated=updated,
+                                            stale_since=stale_since,
+                                            title='{} @ {}: {} (Game #{})'.format(
+                                                self.scoreboard_data.return_away_team(),
+                                                self.scoreboard_data.return_home_team(),
+                                                self.get_game_date_time(), self.game_pk),
+                                            inning_headers=scoreboard_inning_headers,
+                                            away_line=away_line_score,
+                                            home_line=home_line_score,
+                                            status=game_status_info,
+                                            note=self.game_note,
+                                            banner=COPYRIGHT)
+        return self.frame
 
-                # inning headers
-                scoreboard_inning_headers.append(inning_half.upper())
+    def run(self):
 
-                # fill innings
-                scoreboard_inning_headers, \
-                away_line_score, home_line_score = self.build_innings(scoreboard_inning_headers, away_line_score,
-                                                                      home_line_score)
-                # Append team totals to line scores
-                scoreboard_inning_headers += scoreboard_totals_headers
-                away_line_score += away_totals
-                home_line_score += home_totals
+        try:
+            # loop until the game is over
+            end_loop = False
+            while not end_loop:
 
-                # Build bars according to lengths
-                double_bar = '=' * ((len(scoreboard_inning_headers * 5) + len(scoreboard_inning_headers[0])) - 3)
-                single_bar = '-' * len(double_bar)
+                # get updated data from MLB
+                self.livedata = self.refresh_live_data()
 
-                # build status output
-                game_status_info = self.build_game_status_info(len(double_bar)).strip('\n')
+                # nothing changed since the last frame, leave it on screen
+                frame = self.build_frame(self.scoreboard_data.return_stale_since())
+                if frame is self.printed_frame:
+                    self.wait_for_refresh()
+                    continue
 
                 # ---- Print the scoreboard ----
-
-                # print game info line
-                print('{} @ {}: {} (Game #{})'.format(self.scoreboard_data.return_away_team(),
-                                                      self.scoreboard_data.return_home_team(),
-                                                      self.get_game_date_time(), game_pk))
-
-                print(double_bar)
-
-                # Print inning headers
-                output = ''
-                for x in scoreboard_inning_headers:
-                    output += ' {:<3}|'.format(x)
-                print(output)
-                print(single_bar)
-
-                # Print away line score
-                output = ''
-                for i, x in enumerate(away_line_score):
-                    if scoreboard_inning_headers[i] == 'R':
-                        output = output[:-1] + '|'
-                    output += ' {:<3} '.format(x)
-                print(output)
-
-                # Print home line score
-                output = ''
-                for i, y in enumerate(home_line_score):
-                    if scoreboard_inning_headers[i] == 'R':
-                        output = output[:-1] + '|'
-                    output += ' {:<3} '.format(y)
-                print(output)
-
-                print(single_bar)
-
-                # TODO one call to build_game_status_info and print it
-                # then set loop condition based on game_status
-
-                # Game over
-                # if self.game_status.upper() == 'GAME OVER':
-                #     end_loop = True
-                #
-                # if self.game_status.upper() == 'FINAL':
-                #     end_loop = True
-                #
-                # if self.game_status.upper() == 'POSTPONED':
-                #     end_loop = True
-                #
-                # if self.game_status[:9].upper() == 'SUSPENDED':
-                #     end_loop = True
+                self.printer.print_frame(frame)
+                self.printed_frame = frame
 
                 if self.game_status.upper() in GAME_STATUS_ENDED or self.game_status.upper()[:9] in GAME_STATUS_ENDED:
                     end_loop = True
 
-                # Game not started
-                # if self.game_status.upper() == 'SCHEDULED':
-                #     end_loop = True
-
-                # if self.game_status.upper() == 'PRE-GAME':
-                #     end_loop = True
-
                 if self.game_status.upper() in GAME_STATUS_NOT_STARTED:
                     end_loop = True
 
-                # if self.game_status.upper() == 'WARMUP':
-                #     end_loop = False
-
                 if self.game_status.upper() in GAME_STATUS_RUNNING:
                     end_loop = False
 
-                # any other not 'in progress' state
-                # if self.game_status.upper() != 'IN PROGRESS':
-                #     print(game_status_info)
-
-                if self.game_status not in GAME_STATUS_RUNNING:
-                    print(game_status_info)
-
-                # Print game note if there is one
-                if self.game_note:
-                    if len(self.game_note) > len(double_bar):
-                        print('Note: ' + self.game_note[:len(double_bar) - 5])
-                        print('      ' + self.game_note[len(double_bar) - 5 + 1:])
-                    else:
-                        print('Note: ' + self.game_note)
-
-                # if self.game_status.upper() == 'IN PROGRESS':
-                #     print(game_status_info)
-
-                print(double_bar)
-
-                # Print (c) banner
-                print(COPYRIGHT)
-                sys.stdout.flush()
-
                 # Sleep for a while and continue with loop
                 if not end_loop:
-                    if self.game_status.upper() in GAME_STATUS_RUNNING:
-                        loop_cnt = 0
-                        while loop_cnt < self.refresh_rate:
-                            if keyboard.is_pressed('q') or keyboard.is_pressed('esc') or keyboard.is_pressed('ctrl+c'):
-                                print(loop_cnt)
-                                quit(0)
-
-                            if keyboard.is_pressed('l'):
-                                self.print_lineups()
-                                break
-
-                            if keyboard.is_pressed('b'):
-                                # print formatted box score
-                                print('box score')
-                                break
-
-                            time.sleep(1)
-                            loop_cnt += 1
-
-                    
-                    
-                    #if self.game_status.upper() in GAME_STATUS_RUNNING:
-                        #time.sleep(self.refresh_rate)
-                    else:
-                        time.sleep(self.delay_refresh_rate)
-                    #
-                    # if self.game_status[:7].upper() == 'DELAYED' or \
-                    #         self.game_status.upper() == 'WARMUP' or \
-                    #         self.game_status.upper() == ' PRE-GAME':
-                    #     time.sleep(self.delay_refresh_rate)
-                    # else:
-                    #     time.sleep(self.refresh_rate)
+                    self.wait_for_refresh()
         except KeyboardInterrupt:
             print('Exit MLB Live Scoreboard')
 
+    def wait_for_refresh(self):
+        """
+        Sleep until the next refresh, watching for keys.
+
+        :return:
+        """
+        if self.game_status.upper() in GAME_STATUS_RUNNING:
+            loop_cnt = 0
+            while loop_cnt < self.refresh_rate:
+                if keyboard.is_pressed('q') or keyboard.is_pressed('esc') or keyboard.is_pressed('ctrl+c'):
+                    print(loop_cnt)
+                    quit(0)
+
+                if keyboard.is_pressed('l'):
+                    self.print_lineups()
+                    # the lineups cover the scoreboard, so redraw it
+                    self.printed_frame = None
+                    self.printer.reset()
+                    break
+
+                if keyboard.is_pressed('b'):
+                    # print formatted box score
+                    print('box score')
+                    self.printed_frame = None
+                    self.printer.reset()
+                    break
+
+                self.clock.sleep(1)
+                loop_cnt += 1
+        else:
+            self.clock.sleep(self.delay_refresh_rate)
+
     def build_game_status_info(self, sb_width):
         """
         :param sb_width:
@@ -732,20 +656,6 @@ class MLBLiveScoreboard:
 
         return status_line
 
-    def process_subs(self, player_id, batting_order, home_away):
-
-        # update batting order with subs
-        for play_idx in range(len(self.livedata['liveData']['plays']['allPlays'])):
-            play_data = self.get_a_play_data(play_idx)
-            for event_idx in range(len(play_data['playEvents'])):
-                event_data = play_data['playEvents'][event_idx]
-                if 'player' in event_data and 'playerReplaced' in event_data:
-                    if player_id == event_data['player']['id']:
-                        player_replaced_id = event_data['playerReplaced'][id]
-                        batting_order[batting_order.index(player_replaced_id)] = player_id
-
-        return batting_order
-
     def print_lineups(self):
 
         teams_data = self.return_boxscore_data()['teams']
@@ -789,8 +699,6 @@ class MLBLiveScoreboard:
 
         try:
 
-            boxscore = self.get_boxscore_data()
-
             if self.get_current_inning() > 1:
 
                 # get last batter id from previous inning
@@ -818,23 +726,9 @@ class MLBLiveScoreboard:
                 else:
                     last_batter_id = self.scoreboard_data.return_last_batter_ids()[0]
 
-                # get list of batter ids in batting order
-                batting_order = boxscore['teams'][home_or_away]['battingOrder']
-
-                # update batting order if last batter was pinch hitter, etc.
-                if last_batter_id not in batting_order:
-                    batting_order = self.process_subs(last_batter_id, batting_order, home_or_away)
-
-                # find batter id in bat_order list
-                batting_order_idx = batting_order.index(last_batter_id)
-
-                # start with next batter
-                # batting_order_idx += 1
-                for j in range(3):  # get next three batters, rotate to top of order if at end
-                    batting_order_idx += 1
-                    if batting_order_idx > 8:
-                        batting_order_idx = 0
-                    batter_id = batting_order[batting_order_idx]
+                # next three batters from the live batting order, which already
+                # has pinch hitters, etc. in the last batter's slot
+                for batter_id in self.scoreboard_data.return_due_up_ids(home_or_away, last_batter_id):
 
                     # get the batters stats
                     batter_stats = self.get_batter_stats(batter_id)
@@ -843,7 +737,7 @@ class MLBLiveScoreboard:
                     due_up_batters.append('{} ({}-{}), {} AVG'.format(batter_stats[0], batter_stats[1], batter_stats[2],
                                                                       batter_stats[3]))
             else:
-                batting_order = boxscore['teams']['home']['battingOrder']
+                batting_order = self.scoreboard_data.return_batting_order('home')
 
                 for j in range(3):
                     # get the batters stats
@@ -866,50 +760,7 @@ class MLBLiveScoreboard:
         :return:
         """
         # stats: name, hits, atBats, avg
-        stats = ['', '', '', '']
-        found = False
-
-        boxscore = self.get_boxscore_data()
-        # boxscore = self.livedata['liveData']['boxscore']
-
-        try:
-            # # away
-            # for player in boxscore['teams'][home_away]['players']:
-            #     if player == 'ID' + str(batter_id):
-            #         stats[0] = boxscore['teams'][home_away]['players']['ID' + str(batter_id)]['person']['fullName']
-            #         stats[2] = boxscore['teams'][home_away]['players']['ID' + str(batter_id)]['stats']['batting']['atBats']
-            #         stats[1] = boxscore['teams'][home_away]['players']['ID' + str(batter_id)]['stats']['batting']['hits']
-            #         stats[3] = boxscore['teams'][home_away]['players']['ID' + str(batter_id)]['seasonStats']['batting']['avg']
-            #         break
-
-            # away
-            for player in boxscore['teams']['away']['players']:
-                if player == 'ID' + str(batter_id):
-                    stats[0] = boxscore['teams']['away']['players']['ID' + str(batter_id)]['person']['fullName']
-                    stats[2] = boxscore['teams']['away']['players']['ID' + str(batter_id)]['stats']['batting']['atBats']
-                    stats[1] = boxscore['teams']['away']['players']['ID' + str(batter_id)]['stats']['batting']['hits']
-                    stats[3] = boxscore['teams']['away']['players']['ID' + str(batter_id)]['seasonStats']['batting'][
-                        'avg']
-                    found = True
-                    break
-
-                # home
-                if not found:
-                    for player in boxscore['teams']['home']['players']:
-                        if player == 'ID' + str(batter_id):
-                            stats[0] = boxscore['teams']['home']['players']['ID' + str(batter_id)]['person']['fullName']
-                            stats[2] = boxscore['teams']['home']['players']['ID' + str(batter_id)]['stats']['batting'][
-                                'atBats']
-                            stats[1] = boxscore['teams']['home']['players']['ID' + str(batter_id)]['stats']['batting'][
-                                'hits']
-                            stats[3] = \
-                            boxscore['teams']['home']['players']['ID' + str(batter_id)]['seasonStats']['batting']['avg']
-                            break
-
-        except Exception as ex:
-            stats = ['', '', '', '']
-
-        return stats
+        return self.scoreboard_data.return_batter_stats(batter_id)
 
     def get_last_play_description(self):
         """
@@ -926,12 +777,16 @@ class MLBLiveScoreboard:
             play_data = self.get_current_play_data()
             if 'description' in play_data['result']:
                 description = play_data['result']['description']
-            if len(description) == 0:
-                play_data = self.get_last_play_data()
-                description = play_data['result']['description']
-            event = play_data['result']['event']
-            play_inning = play_data['about']['inning']
-            play_inning_half = str(play_data['about']['halfInning']).upper()
+            if len(description) > 0:
+                event = play_data['result']['event']
+                play_inning = play_data['about']['inning']
+                play_inning_half = str(play_data['about']['halfInning']).upper()
+            else:
+                logged_play = self.scoreboard_data.return_last_logged_play()
+                description = logged_play['description']
+                event = logged_play['event']
+                play_inning = logged_play['inning']
+                play_inning_half = str(logged_play['inning_half']).upper()
 
             # add inning to commentary
             current_inning = self.get_current_inning()
@@ -1200,7 +1055,6 @@ if __name__ == "__main__":
     print(COPYRIGHT)
 
     # Init some stuff
-    scoreboard = MLBLiveScoreboard()
     game_pk = 0
     favorite_team = None
 
@@ -1259,8 +1113,46 @@ if __name__ == "__main__":
                         help='Load specific game')
     parser.add_argument('--all_teams', required=False, default=False, action='store_true',
                         help='List all team tri-graphs')
+    parser.add_argument('--history', required=False, default=False, action='store_true',
+                        help='List games kept in the database file, optionally for --team')
+    parser.add_argument('--record', required=False, dest='record_file',
+                        help='Record all MLB data received to this file')
+    parser.add_argument('--replay', required=False, dest='replay_file',
+                        help='Play back a game recorded with --record')
+    parser.add_argument('--speed', required=False, default=1.0, type=float, dest='speed',
+                        help='Playback speed for --replay, e.g. 10 for 10x (0 = no waiting)')
+    parser.add_argument('--output', required=False, default='terminal', choices=['terminal', 'json', 'html'],
+                        dest='output', help='Show the scoreboard as text, JSON lines or an HTML page')
+    parser.add_argument('--output-file', required=False, dest='output_file',
+                        help='Write the --output html page to this file instead of the screen')
+    parser.add_argument('--grid', required=False, default=False, action='store_true',
+                        help='Show every game of the day, or of --date, on one screen')
+    parser.add_argument('--columns', required=False, default=2, type=int, dest='columns',
+                        help='Games per row for --grid')
+    parser.add_argument('--focus', required=False, type=int, nargs='+', dest='focus',
+                        help='Games the --grid follows pitch by pitch from their full live feeds')
     args = parser.parse_args()
 
+    # record from the first request, the teams loaded at startup included
+    recorder = None
+    if args.record_file is not None:
+        recorder = feed_replay.FeedRecorder(args.record_file)
+
+    # replay a recorded game instead of calling MLB
+    if args.replay_file is not None:
+        api = feed_replay.MLB_API_Replay(args.replay_file)
+        api.clock.speed = args.speed
+        scoreboard = MLBLiveScoreboard(api, api.clock)
+        if args.gamepk is None and len(api.game_pks()) > 0:
+            args.gamepk = api.game_pks()[0]
+    else:
+        scoreboard = MLBLiveScoreboard(mlb_api.MLB_API(recorder=recorder))
+
+    if args.output == 'json':
+        scoreboard.printer = scoreboard_frame.JSONPrinter()
+    elif args.output == 'html':
+        scoreboard.printer = scoreboard_frame.HTMLPrinter(args.output_file, scoreboard.refresh_rate)
+
     # today's date
     game_date = datetime.datetime.now().strftime('%m/%d/%Y')
 
@@ -1273,6 +1165,34 @@ if __name__ == "__main__":
         else:
             game_pk = scoreboard.find_gamepk(favorite_team, '', game_date)
 
+    # list games kept from earlier runs
+    elif args.history:
+        if not scoreboard.scoreboard_data.scoreboard_db.is_persistent():
+            sys.exit('ERROR: Set db_file in config.py to keep game history.')
+        games = scoreboard.scoreboard_data.return_game_history(args.favorite_team or '')
+        for game in games:
+            print('{} - {} @ {} - {} ({})'.format(game[0], game[1], game[2], game[3], game[4]))
+        if len(games) == 0:
+            print('No games found.')
+        sys.exit()
+
+    # every game of the day
+    elif args.grid:
+        if args.game_date is not None:
+            if not _validate_date(args.game_date):
+                _usage()
+                sys.exit('ERROR:  Invalid date: {}'.format(args.game_date))
+            game_date = args.game_date
+        grid = scoreboard_grid.ScoreboardGrid(scoreboard.api, args.columns, COPYRIGHT,
+                                              scoreboard.scoreboard_data, args.focus)
+        try:
+            if grid.load_games(game_date) == 0:
+                sys.exit('MLB day off; no games scheduled.\n')
+        except mlb_api.MLBAPIError as err:
+            sys.exit('ERROR: Could not load schedule. {}'.format(err))
+        grid.run()
+        sys.exit()
+
     # use favorite team arg
     elif args.favorite_team is not None and args.game_date is None:
         favorite_team = args.favorite_team
@@ -1294,7 +1214,10 @@ if __name__ == "__main__":
             _usage()
             sys.exit('ERROR:  Invalid date: {}'.format(args.game_date))
         else:
-            schedule = scoreboard.api.fetch_schedule_data(args.game_date)
+            try:
+                schedule = scoreboard.api.fetch_schedule_data(args.game_date)
+            except mlb_api.MLBAPIError as err:
+                sys.exit('ERROR: Could not load schedule. {}'.format(err))
             if schedule['totalGames'] > 0:
                 print('Games on {}:'.format(args.game_date))
                 for games in schedule['dates'][0]['games']:
@@ -1356,7 +1279,10 @@ if __name__ == "__main__":
         scoreboard.run()
 
     else:
-        schedule = scoreboard.api.fetch_schedule_data(game_date)
+        try:
+            schedule = scoreboard.api.fetch_schedule_data(game_date)
+        except mlb_api.MLBAPIError as err:
+            sys.exit('ERROR: Could not load schedule. {}'.format(err))
         if schedule['totalGames'] == 0:
             print('MLB day off; no games scheduled.\n')
             sys.exit()
@@ -0,0 +1,81 @@
+import argparse
+import time
+
+import database
+
+"""
+Time a cold start load of the teams and players tables, inserting one row at
+a time with Database.db_insert (a commit per row) against one transaction
+with Database.db_insert_many.  Rows are synthetic but shaped like a real
+load: 30 teams and two rosters per game.
+
+  >python benchmark_db_load.py --players 80 --runs 20
+  >python benchmark_db_load.py --db_file bench.db
+"""
+
+TEAMS = '''CREATE TABLE teams (team_name TEXT,
+                               team_abbrev TEXT,
+                               team_short_name TEXT,
+                               team_id INTEGER);'''
+
+PLAYERS = '''CREATE TABLE players (player_name TEXT,
+                                   player_number INTEGER,
+                                   player_id INTEGER,
+                                   player_team_abbrev TEXT,
+                                   batting_order INTEGER);'''
+
+
+def build_rows(players):
+    teams = [{'team_name': 'Team {}'.format(i),
+              'team_abbrev': 'T{:02}'.format(i),
+              'team_short_name': 'Short {}'.format(i),
+              'team_id': 100 + i} for i in range(30)]
+    roster = [{'player_name': 'Player {}'.format(i),
+               'player_number': i % 99,
+               'player_id': 500000 + i,
+               'player_team_abbrev': 'T{:02}'.format(i % 2)} for i in range(players)]
+    return teams, roster
+
+
+def load(db_file, teams, roster, bulk):
+    db = database.Database(db_file)
+    db.db_query('DROP TABLE IF EXISTS teams')
+    db.db_query('DROP TABLE IF EXISTS players')
+    db.db_query(TEAMS)
+    db.db_query(PLAYERS)
+
+    start = time.perf_counter()
+    if bulk:
+        db.db_insert_many('teams', teams)
+        db.db_insert_many('players', roster)
+    else:
+        for row in teams:
+            db.db_insert('teams', row)
+        for row in roster:
+            db.db_insert('players', row)
+    elapsed = time.perf_counter() - start
+
+    db.get_connection().close()
+    return elapsed
+
+
+def run_benchmark(db_file, players, runs):
+    teams, roster = build_rows(players)
+
+    print('{} teams + {} players into {}, best of {} runs'.format(len(teams), len(roster), db_file, runs))
+    for name, bulk in [('db_insert', False), ('db_insert_many', True)]:
+        best = min(load(db_file, teams, roster, bulk) for i in range(runs))
+        print('{:<16} {:>10.2f} ms'.format(name, best * 1000))
+
+
+##### MAIN #####
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='benchmark_db_load')
+    parser.add_argument('--db_file', required=False, default=':memory:', dest='db_file',
+                        help='Database file, an on-disk file shows the cost of each commit')
+    parser.add_argument('--players', required=False, default=80, type=int, dest='players',
+                        help='Players per game')
+    parser.add_argument('--runs', required=False, default=10, type=int, dest='runs')
+    args = parser.parse_args()
+
+    run_benchmark(args.db_file, args.players, args.runs)
@@ -0,0 +1,100 @@
+import argparse
+import json
+import time
+
+import feed_replay
+import json_decoders
+
+"""
+Time decoding of recorded live feeds with every installed JSON decoder.
+
+Feeds come from logs recorded with MLB-live-scoreboard3.py --record and/or
+from saved feed/live JSON files.  From each recorded game the last feed of
+the early innings (1-3), the late innings (7-9) and extra innings is timed,
+so feed size grows down the table.
+
+  >python benchmark_decode.py --log game.log.gz --runs 50
+  >python benchmark_decode.py --feed feed_live.json
+"""
+
+
+def feed_inning(live_data):
+    try:
+        return int(live_data['liveData']['linescore']['currentInning'])
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+
+def sample_feeds(log_files, feed_files):
+    """
+    Return (label, feed bytes) pairs to time.
+
+    :param log_files:
+    :param feed_files:
+    :return:
+    """
+    samples = []
+
+    for log_file in log_files:
+        for game_pk, states in feed_replay.rebuild_feeds(feed_replay.read_log(log_file)).items():
+            stages = {}
+            for live_data in states:
+                inning = feed_inning(live_data)
+                if 1 <= inning <= 3:
+                    stages['early'] = live_data
+                elif 7 <= inning <= 9:
+                    stages['late'] = live_data
+                elif inning > 9:
+                    stages['extras'] = live_data
+
+            for stage in ['early', 'late', 'extras']:
+                if stage in stages:
+                    samples.append(('{} {}'.format(game_pk, stage), json.dumps(stages[stage]).encode('utf-8')))
+
+    for feed_file in feed_files:
+        with open(feed_file, 'rb') as f:
+            samples.append((feed_file, f.read()))
+
+    return samples
+
+
+def time_decoder(decode, content, runs):
+    best = None
+    for i in range(runs):
+        start = time.perf_counter()
+        decode(content)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def run_benchmark(log_files, feed_files, runs):
+    samples = sample_feeds(log_files, feed_files)
+    if len(samples) == 0:
+        print('No feeds found to decode.')
+        return
+
+    decoders = list(json_decoders.DECODERS.keys())
+    print('Best of {} runs, milliseconds'.format(runs))
+    print('{:<24} {:>10}'.format('feed', 'KB') + ''.join(' {:>10}'.format(name) for name in decoders))
+
+    for label, content in samples:
+        line = '{:<24} {:>10,.0f}'.format(label[-24:], len(content) / 1024)
+        for name in decoders:
+            line += ' {:>10.2f}'.format(time_decoder(json_decoders.DECODERS[name], content, runs) * 1000)
+        print(line)
+
+
+##### MAIN #####
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='benchmark_decode')
+    parser.add_argument('--log', required=False, default=[], action='append', dest='log_files',
+                        help='Log recorded with --record (may be repeated)')
+    parser.add_argument('--feed', required=False, default=[], action='append', dest='feed_files',
+                        help='Saved feed/live JSON file (may be repeated)')
+    parser.add_argument('--runs', required=False, default=20, type=int, dest='runs',
+                        help='Decodes per feed and decoder')
+    args = parser.parse_args()
+
+    run_benchmark(args.log_files, args.feed_files, args.runs)
@@ -0,0 +1,67 @@
+import argparse
+import json
+import time
+
+import mlb_api
+
+"""
+Compare payload size and JSON decode time of the full live feed against the
+field projections in MLB_API.FEED_PROJECTIONS.
+
+  >python benchmark_projection.py --gamepk 567241 --runs 5
+"""
+
+
+def time_request(api, url, runs):
+    payload_bytes = 0
+    transfer_time = 0.0
+    decode_time = 0.0
+
+    for i in range(runs):
+        start = time.perf_counter()
+        response = api.get_session().get(url, timeout=api.timeout)
+        content = response.content
+        transfer_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        json.loads(content)
+        decode_time += time.perf_counter() - start
+
+        payload_bytes = len(content)
+
+    return payload_bytes, transfer_time / runs, decode_time / runs
+
+
+def run_benchmark(game_pk, runs):
+    api = mlb_api.MLB_API()
+
+    requests_to_time = [('full', api.API_LIVEFEED_URL.format(game_pk))]
+    for projection in api.FEED_PROJECTIONS:
+        requests_to_time.append((projection,
+                                 api.API_LIVEFEED_FIELDS_URL.format(game_pk, api.build_fields(projection))))
+
+    print('{:<12} {:>12} {:>14} {:>14}'.format('feed', 'bytes', 'fetch (ms)', 'decode (ms)'))
+    full_bytes = 0
+    for name, url in requests_to_time:
+        payload_bytes, transfer_time, decode_time = time_request(api, url, runs)
+        if name == 'full':
+            full_bytes = payload_bytes
+        print('{:<12} {:>12,} {:>14.1f} {:>14.2f}'.format(name, payload_bytes, transfer_time * 1000,
+                                                          decode_time * 1000), end='')
+        if name != 'full' and full_bytes > 0:
+            print('  ({:.1%} of full)'.format(payload_bytes / full_bytes))
+        else:
+            print()
+
+    api.close()
+
+
+##### MAIN #####
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='benchmark_projection')
+    parser.add_argument('--gamepk', required=True, dest='gamepk', help='Game to fetch')
+    parser.add_argument('--runs', required=False, default=5, type=int, dest='runs',
+                        help='Requests per feed')
+    args = parser.parse_args()
+
+    run_benchmark(args.gamepk, args.runs)
@@ -4,7 +4,76 @@ SB_CONFIG = {
     # refresh rate in seconds
     'refresh': 20,
     # refresh rate during game delay in seconds
-    'delay': 90
+    'delay': 90,
+    # how the live feed is refreshed: 'full' fetches the whole feed each time,
+    # 'incremental' applies diffPatch changes to the last feed, 'projected'
+    # fetches only the fields the scoreboard reads each time, 'streamed'
+    # fetches the whole feed but only decodes what the scoreboard reads
+    # (needs the ijson package to save memory)
+    'live_feed': 'full',
+    # also write game status and game info to the database tables
+    'persist_status': False,
+    # database file; ':memory:' starts empty every run, a file name keeps
+    # teams, players and games from run to run
+    'db_file': ':memory:',
+    # keep only what the scoreboard reads of each live feed between refreshes
+    'compact_live_data': True,
+    # how --grid keeps games current: 'slate' polls one schedule request for
+    # every game and live feeds only for --focus games, 'feeds' polls the
+    # live feed of every game
+    'grid_poll': 'slate'
+}
+
+API_CONFIG = {
+    # root of the MLB stats API; change to point at a local stand-in server
+    'base_url': 'http://statsapi.mlb.com/api',
+    # number of host connection pools kept by the HTTP session
+    'pool_connections': 4,
+    # max keep-alive connections kept per host
+    'pool_maxsize': 16,
+    # max requests the async client runs at once (keep <= pool_maxsize)
+    'max_concurrency': 16,
+    # connect timeout in seconds
+    'connect_timeout': 5,
+    # read timeout in seconds
+    'read_timeout': 15,
+    # JSON decoder: 'auto' (fastest installed), 'orjson', 'ujson' or 'json'
+    'json_decoder': 'auto',
+    # times a failed request is retried
+    'retries': 3,
+    # first retry delay in seconds, doubled on each retry up to backoff_max
+    'backoff': 0.5,
+    'backoff_max': 8,
+    # failures in a row before requests to an endpoint are suspended
+    'breaker_failures': 5,
+    # seconds before a suspended endpoint is tried again
+    'breaker_reset': 60,
+    # requests per second to MLB shared by every scoreboard on this host, in
+    # total and per endpoint (None = no limit for that entry)
+    'rate_limits': {
+        'total': 10,
+        'live_feed': 10,
+        'schedule': 2,
+        'teams': 1,
+        'default': 2
+    },
+    # share of the total rate kept for live feed polls
+    'rate_reserve': 0.2,
+    # file holding the shared rate limit state (None = temp directory)
+    'rate_state_file': None,
+    # seconds a response is shared with other requests for the same URL
+    # in this process, e.g. several scoreboards following one game (0 = off)
+    'coalesce_window': 2,
+    # seconds a cached response is served without asking MLB again (0 = no cache)
+    'cache_ttl': {
+        'teams': 86400,
+        'schedule': 300,
+        'slate': 0,
+        'live_feed': 0
+    },
+    # file used to keep cached responses between runs, e.g.
+    # 'MLB-live-scoreboard-cache.json' (None = memory only)
+    'cache_file': None
 }
 
 
@@ -9,6 +9,15 @@ class Database:
         self.db_file = db_file
         self.db_conn = self.get_connection()
 
+        # file databases are kept between runs; WAL lets readers and the
+        # scoreboard's writes overlap and makes each commit cheaper
+        if self.is_persistent():
+            self.db_query('PRAGMA journal_mode=WAL')
+            self.db_query('PRAGMA synchronous=NORMAL')
+
+    def is_persistent(self):
+        return self.db_file != ':memory:'
+
     def get_connection(self):
         if self.db_conn is None:
             self.db_conn = sqlite3.connect(self.db_file)
@@ -61,6 +70,35 @@ class Database:
 
         return rows
 
+    def db_insert_many(self, table, rows: list):
+        """
+        Insert a list of row dicts with one prepared statement in a single
+        transaction.  All rows must have the same columns as the first one.
+        If any row fails, none are inserted.
+
+        :param table:
+        :param rows:
+        :return: number of rows inserted
+        """
+        if len(rows) == 0:
+            return 0
+
+        columns = list(rows[0].keys())
+        placeholders = ','.join(['?'] * len(columns))
+        values = [[row[column] for column in columns] for row in rows]
+
+        sql = 'INSERT INTO {} ({}) VALUES ({})'.format(table, ','.join(columns), placeholders)
+
+        try:
+            conn = self.get_connection()
+            with conn:
+                conn.executemany(sql, values)
+        except (sqlite3.Error, KeyError) as err:
+            print('Insert error: {}'.format(err))
+            return 0
+
+        return len(values)
+
     def db_delete(self, table, cond=''):
         sql = 'DELETE from {}'.format(table)
         if len(cond) > 0:
@@ -0,0 +1,212 @@
+import copy
+import gzip
+import json
+import re
+import threading
+import time
+
+import feed_stream
+import json_patch
+import mlb_api
+
+"""
+Record and replay of MLB data.
+
+FeedRecorder is attached to an MLB_API as its recorder and appends every
+response it returns (teams, schedule, full live feeds and diffPatch patches)
+to a gzipped log, one JSON record per line:
+
+    {"t": 1563412597.31, "url": "http://statsapi.mlb.com/api/v1.1/game/564977/feed/live", "data": {...}}
+
+MLB_API_Replay serves the same MLB_API interface from that log.  It reads the
+time from a ReplayClock, which the scoreboard also sleeps on, so a game can be
+played back at real speed or N times faster without touching the network.
+"""
+
+LIVEFEED_RE = re.compile(r'/game/(\d+)/feed/live(/diffPatch)?')
+
+
+class Clock:
+    """
+    Wall clock used by the scoreboard for sleeping between refreshes.
+    """
+
+    @staticmethod
+    def now():
+        return time.time()
+
+    @staticmethod
+    def sleep(seconds):
+        time.sleep(seconds)
+
+
+class ReplayClock(Clock):
+    """
+    Fake clock for playback.  Time starts at start_time and only moves when
+    the scoreboard sleeps; each sleep takes seconds / speed of real time, or
+    no real time at all when speed is 0.
+    """
+
+    start_time = 0.0
+    elapsed = 0.0
+    speed = 1.0
+
+    def __init__(self, start_time, speed=1.0):
+        self.start_time = start_time
+        self.elapsed = 0.0
+        self.speed = float(speed)
+
+    def now(self):
+        return self.start_time + self.elapsed
+
+    def sleep(self, seconds):
+        self.elapsed += seconds
+        if self.speed > 0:
+            time.sleep(seconds / self.speed)
+
+
+class FeedRecorder:
+    log_file = None
+    log = None
+    lock = None
+
+    def __init__(self, log_file):
+        self.log_file = log_file
+        self.log = gzip.open(log_file, 'at', encoding='utf-8')
+        self.lock = threading.Lock()
+
+    def record(self, url, data):
+        line = json.dumps({'t': round(time.time(), 3), 'url': url, 'data': data}, separators=(',', ':'))
+        with self.lock:
+            self.log.write(line + '\n')
+            self.log.flush()
+
+    def close(self):
+        self.log.close()
+
+
+def read_log(log_file):
+    """
+    Return the records of a recorded log in the order they were written.
+
+    :param log_file:
+    :return:
+    """
+    records = []
+    with gzip.open(log_file, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if len(line.strip()) > 0:
+                records.append(json.loads(line))
+    return records
+
+
+def rebuild_feeds(records):
+    """
+    Return every recorded state of each game's live feed as a complete feed,
+    applying recorded diffPatch patches to the feed before them.
+
+    :param records: from read_log()
+    :return: dict of game_pk to a list of feeds, oldest first
+    """
+    feeds = {}
+    for record in records:
+        match = LIVEFEED_RE.search(record['url'])
+        if match is None:
+            continue
+
+        states = feeds.setdefault(int(match.group(1)), [])
+        if isinstance(record['data'], dict):
+            states.append(record['data'])
+        elif len(states) > 0 and len(record['data']) > 0:
+            live_data = copy.deepcopy(states[-1])
+            for patch in record['data']:
+                json_patch.apply_patch(live_data, patch['diff'])
+            states.append(live_data)
+    return feeds
+
+
+class MLB_API_Replay(mlb_api.MLB_API):
+    """
+    MLB_API backend that answers from a recorded log instead of the network.
+    Each call returns what MLB had sent by the replay clock's current time.
+    Live feeds are rebuilt from the recorded full feeds and patches, and
+    diffPatch requests are answered with the whole rebuilt feed, which the
+    incremental refresh accepts as a full update.
+    """
+
+    records = None
+    clock = None
+    feeds = None
+
+    def __init__(self, log_file, clock=None):
+        self.records = read_log(log_file)
+        if len(self.records) == 0:
+            raise ValueError('No records in replay log {}'.format(log_file))
+
+        super().__init__()
+        self.clock = clock if clock is not None else ReplayClock(self.records[0]['t'])
+
+        # per game: [index of next record to apply, rebuilt feed]
+        self.feeds = {}
+
+    def get_session(self):
+        return None
+
+    def close(self):
+        pass
+
+    def game_pks(self):
+        game_pks = []
+        for record in self.records:
+            match = LIVEFEED_RE.search(record['url'])
+            if match is not None and int(match.group(1)) not in game_pks:
+                game_pks.append(int(match.group(1)))
+        return game_pks
+
+    def fetch_data(self, url, ttl=0, fallback=True):
+        results = None
+        now = self.clock.now()
+
+        # latest response to this url by now, or the first one if it came later
+        for record in self.records:
+            if record['url'] == url:
+                if results is None or record['t'] <= now:
+                    results = record['data']
+                else:
+                    break
+
+        if results is None:
+            raise mlb_api.MLBAPIError('No recorded data for {}'.format(url))
+
+        return copy.deepcopy(results)
+
+    def fetch_live_feed_data(self, game_pk, projection=None):
+        game_pk = int(game_pk)
+        now = self.clock.now()
+        next_idx, live_data = self.feeds.get(game_pk, (0, None))
+
+        for idx in range(next_idx, len(self.records)):
+            record = self.records[idx]
+            match = LIVEFEED_RE.search(record['url'])
+            if match is not None and int(match.group(1)) == game_pk:
+                if record['t'] > now and live_data is not None:
+                    break
+                if isinstance(record['data'], dict):
+                    live_data = copy.deepcopy(record['data'])
+                elif live_data is not None:
+                    for patch in record['data']:
+                        json_patch.apply_patch(live_data, patch['diff'])
+            next_idx = idx + 1
+
+        if live_data is None:
+            raise mlb_api.MLBAPIError('No recorded live feed for game {}'.format(game_pk))
+
+        self.feeds[game_pk] = (next_idx, live_data)
+        return copy.deepcopy(live_data)
+
+    def fetch_live_feed_streamed(self, game_pk, projection):
+        return feed_stream.prune(self.fetch_live_feed_data(game_pk),
+                                 feed_stream.build_path_tree(self.FEED_PROJECTIONS[projection]))
+
+    def fetch_live_feed_patch(self, game_pk, start_timecode):
+        return self.fetch_live_feed_data(game_pk)
@@ -0,0 +1,143 @@
+import json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+"""
+Extract only selected subtrees from a JSON document.
+
+Paths are dotted object keys, as in MLB_API.FEED_PROJECTIONS: '*' matches any
+key and list levels are not named, so 'liveData.plays.allPlays.result.event'
+keeps the event of every play.  Everything at or below a path is kept;
+objects and lists on the way to a path are kept with only the selected
+members.
+
+With ijson installed the response is parsed as a stream and nothing outside
+the selected paths is ever built.  Without it the document is decoded in full
+and then pruned, which gives the same result without the memory savings.
+"""
+
+
+def build_path_tree(paths):
+    """
+    Turn dotted paths into a nested dict of keys.  An empty dict marks a path
+    end, below which everything is kept.
+
+    :param paths:
+    :return:
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('.'):
+            if name not in node:
+                node[name] = {}
+            node = node[name]
+
+        # a shorter path wins over longer ones through the same key
+        node.clear()
+        node[None] = True
+    return tree
+
+
+def _child(node, key):
+    if node is None:
+        return None
+    child = node.get(key, node.get('*'))
+    if child is None:
+        return False
+    if None in child:
+        return None
+    return child
+
+
+def prune(data, tree):
+    """
+    Return the parts of an already decoded document selected by tree.
+
+    :param data:
+    :param tree: from build_path_tree()
+    :return:
+    """
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [prune(item, tree) for item in data]
+    if isinstance(data, dict):
+        pruned = {}
+        for key, value in data.items():
+            child = _child(tree, key)
+            if child is not False:
+                pruned[key] = prune(value, child)
+        return pruned
+    return data
+
+
+def extract(stream, tree):
+    """
+    Parse a JSON document from a binary stream, building only the parts
+    selected by tree.
+
+    :param stream: file-like object returning bytes
+    :param tree: from build_path_tree()
+    :return:
+    """
+    if ijson is None:
+        return prune(json.load(stream), tree)
+
+    root = None
+    skip_depth = 0
+    key = None
+
+    # one [container, path tree node] per open object/list being kept
+    stack = []
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if skip_depth > 0:
+            if event in ('start_map', 'start_array'):
+                skip_depth += 1
+            elif event in ('end_map', 'end_array'):
+                skip_depth -= 1
+            continue
+
+        if event == 'map_key':
+            key = value
+            continue
+
+        if event in ('end_map', 'end_array'):
+            stack.pop()
+            continue
+
+        # a value starts: find its path tree node from its parent
+        if len(stack) == 0:
+            node = tree
+        elif isinstance(stack[-1][0], list):
+            node = stack[-1][1]
+        else:
+            node = _child(stack[-1][1], key)
+
+        if node is False:
+            if event in ('start_map', 'start_array'):
+                skip_depth = 1
+            continue
+
+        if event == 'start_map':
+            item = {}
+        elif event == 'start_array':
+            item = []
+        else:
+            item = value
+
+        if len(stack) == 0:
+            root = item
+        elif isinstance(stack[-1][0], list):
+            stack[-1][0].append(item)
+        else:
+            stack[-1][0][key] = item
+
+        if event in ('start_map', 'start_array'):
+            stack.append([item, node])
+
+    return root
@@ -0,0 +1,48 @@
+"""
+Typed events for what changed in a game between two refreshes.
+
+ScoreboardData.refresh_live_data compares each refresh with the last one and
+publishes one event per change to the callbacks registered with
+ScoreboardData.subscribe().  Events carry the game_pk and the fields named in
+their class's fields tuple.
+"""
+
+
+class GameEvent:
+    fields = ()
+
+    def __init__(self, game_pk, **values):
+        self.game_pk = game_pk
+        for name in self.fields:
+            setattr(self, name, values.get(name))
+
+    def __repr__(self):
+        return '{}(game_pk={!r}, {})'.format(type(self).__name__, self.game_pk,
+                                             ', '.join('{}={!r}'.format(name, getattr(self, name))
+                                                       for name in self.fields))
+
+
+class NewPitch(GameEvent):
+    fields = ('at_bat_index', 'pitcher_id', 'batter_id', 'pitch_number', 'description', 'pitch_type',
+              'pitch_count')
+
+
+class NewPlay(GameEvent):
+    fields = ('at_bat_index', 'inning', 'inning_half', 'batter_id', 'pitcher_id', 'event', 'description',
+              'is_scoring_play')
+
+
+class ScoreChange(GameEvent):
+    fields = ('away_score', 'home_score', 'previous_away_score', 'previous_home_score')
+
+
+class StatusChange(GameEvent):
+    fields = ('game_status', 'previous_game_status')
+
+
+class InningChange(GameEvent):
+    fields = ('inning', 'inning_half', 'inning_state')
+
+
+class Substitution(GameEvent):
+    fields = ('side', 'player_id', 'replaced_id', 'slot')
@@ -0,0 +1,97 @@
+class GameSnapshot:
+    """
+    Immutable view of a game's status, teams and game info, rebuilt once per
+    refresh by ScoreboardData.  Reading it costs an attribute lookup, so the
+    scoreboard can ask for the game status as often as it likes while drawing
+    a frame.  Use replace() to build the next snapshot; the version only
+    moves when the game has changed, so two frames drawn from snapshots with
+    the same version are identical.
+    """
+
+    __slots__ = ('version',
+                 'game_pk',
+                 'game_status',
+                 'current_inning',
+                 'current_inning_half',
+                 'current_inning_state',
+                 'current_play_idx',
+                 'current_play_events',
+                 'balls',
+                 'strikes',
+                 'outs',
+                 'away_score',
+                 'home_score',
+                 'home_last_batter_id',
+                 'away_last_batter_id',
+                 'home_team_id',
+                 'home_team_abbrev',
+                 'home_team_name',
+                 'away_team_id',
+                 'away_team_abbrev',
+                 'away_team_name',
+                 'last_update')
+
+    DEFAULTS = {'version': 0,
+                'game_pk': 0,
+                'game_status': 'UNK',
+                'current_inning': '',
+                'current_inning_half': '',
+                'current_inning_state': '',
+                'current_play_idx': 0,
+                'current_play_events': 0,
+                'balls': 0,
+                'strikes': 0,
+                'outs': 0,
+                'away_score': 0,
+                'home_score': 0,
+                'home_last_batter_id': 0,
+                'away_last_batter_id': 0,
+                'home_team_id': '',
+                'home_team_abbrev': 'UNK',
+                'home_team_name': 'UNK',
+                'away_team_id': '',
+                'away_team_abbrev': 'UNK',
+                'away_team_name': 'UNK',
+                'last_update': None}
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.get(name, self.DEFAULTS[name]))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('GameSnapshot is immutable, use replace()')
+
+    def __delattr__(self, name):
+        raise AttributeError('GameSnapshot is immutable, use replace()')
+
+    def __repr__(self):
+        return 'GameSnapshot({})'.format(', '.join('{}={!r}'.format(name, getattr(self, name))
+                                                   for name in self.__slots__))
+
+    def replace(self, **changes):
+        """
+        Return a new snapshot with changes applied and the version bumped.
+
+        :param changes:
+        :return:
+        """
+        fields = self.as_dict()
+        fields.update(changes)
+        fields['version'] = self.version + 1
+        return GameSnapshot(**fields)
+
+    def differs(self, changes):
+        """
+        Return True if applying changes would change anything but the time of
+        the last update.
+
+        :param changes:
+        :return:
+        """
+        for name, value in changes.items():
+            if name not in ('version', 'last_update') and getattr(self, name) != value:
+                return True
+        return False
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
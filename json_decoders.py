@@ -0,0 +1,41 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+"""
+JSON decoder backends for MLB_API.  Every backend takes the raw response
+bytes and returns plain dicts and lists.  The standard library json module
+is always available; orjson and ujson are used when installed.
+"""
+
+# fastest first, used to pick a backend for 'auto'
+DECODERS = {}
+if orjson is not None:
+    DECODERS['orjson'] = orjson.loads
+if ujson is not None:
+    DECODERS['ujson'] = ujson.loads
+DECODERS['json'] = json.loads
+
+
+def get_decoder(name='auto'):
+    """
+    Return the decode function for a backend name, or the fastest installed
+    backend for 'auto'.  An unknown or missing backend falls back to json.
+
+    :param name:
+    :return:
+    """
+    if name == 'auto':
+        return list(DECODERS.values())[0]
+    if name not in DECODERS:
+        print('JSON decoder {} is not available, using json'.format(name))
+        return DECODERS['json']
+    return DECODERS[name]
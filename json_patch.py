@@ -0,0 +1,127 @@
+import copy
+
+
+class JsonPatchError(Exception):
+    pass
+
+
+def _split_pointer(pointer):
+    """
+    Split a JSON pointer (RFC 6901) into its unescaped reference tokens.
+
+    :param pointer:
+    :return:
+    """
+    if pointer == '':
+        return []
+    if not pointer.startswith('/'):
+        raise JsonPatchError('Invalid JSON pointer: {}'.format(pointer))
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer[1:].split('/')]
+
+
+def _list_index(container, token, allow_end=False):
+    if token == '-' and allow_end:
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == '0'):
+        raise JsonPatchError('Invalid list index: {}'.format(token))
+    idx = int(token)
+    if idx > len(container) or (idx == len(container) and not allow_end):
+        raise JsonPatchError('List index out of range: {}'.format(token))
+    return idx
+
+
+def _resolve_parent(doc, pointer):
+    tokens = _split_pointer(pointer)
+    if len(tokens) == 0:
+        raise JsonPatchError('Cannot operate on the document root')
+
+    parent = doc
+    for token in tokens[:-1]:
+        try:
+            if isinstance(parent, list):
+                parent = parent[_list_index(parent, token)]
+            else:
+                parent = parent[token]
+        except (KeyError, TypeError):
+            raise JsonPatchError('Path not found: {}'.format(pointer))
+    return parent, tokens[-1]
+
+
+def _get(doc, pointer):
+    parent, key = _resolve_parent(doc, pointer)
+    try:
+        if isinstance(parent, list):
+            return parent[_list_index(parent, key)]
+        return parent[key]
+    except (KeyError, TypeError):
+        raise JsonPatchError('Path not found: {}'.format(pointer))
+
+
+def _add(doc, pointer, value):
+    parent, key = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        parent.insert(_list_index(parent, key, allow_end=True), value)
+    elif isinstance(parent, dict):
+        parent[key] = value
+    else:
+        raise JsonPatchError('Path not found: {}'.format(pointer))
+
+
+def _remove(doc, pointer):
+    parent, key = _resolve_parent(doc, pointer)
+    try:
+        if isinstance(parent, list):
+            return parent.pop(_list_index(parent, key))
+        return parent.pop(key)
+    except (KeyError, TypeError, AttributeError):
+        raise JsonPatchError('Path not found: {}'.format(pointer))
+
+
+def _replace(doc, pointer, value):
+    parent, key = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        parent[_list_index(parent, key)] = value
+    elif isinstance(parent, dict) and key in parent:
+        parent[key] = value
+    else:
+        raise JsonPatchError('Path not found: {}'.format(pointer))
+
+
+def apply_patch(doc, operations):
+    """
+    Apply a list of JSON patch (RFC 6902) operations to doc in place.  The
+    root document itself cannot be replaced, which is all the MLB diffPatch
+    feed ever needs.  Raises JsonPatchError if an operation does not apply,
+    in which case doc may be partially patched and should be discarded.
+
+    Values are copied into doc, never shared with operations: the same
+    coalesced patch list may be applied to several viewers' documents.
+
+    :param doc:
+    :param operations:
+    :return: the patched document
+    """
+    for operation in operations:
+        try:
+            op = operation['op']
+            path = operation['path']
+
+            if op == 'add':
+                _add(doc, path, copy.deepcopy(operation['value']))
+            elif op == 'remove':
+                _remove(doc, path)
+            elif op == 'replace':
+                _replace(doc, path, copy.deepcopy(operation['value']))
+            elif op == 'move':
+                _add(doc, path, _remove(doc, operation['from']))
+            elif op == 'copy':
+                _add(doc, path, copy.deepcopy(_get(doc, operation['from'])))
+            elif op == 'test':
+                if _get(doc, path) != operation['value']:
+                    raise JsonPatchError('Test failed: {}'.format(path))
+            else:
+                raise JsonPatchError('Unknown patch operation: {}'.format(op))
+        except KeyError as err:
+            raise JsonPatchError('Malformed patch operation, missing {}'.format(err))
+
+    return doc
@@ -0,0 +1,102 @@
+import argparse
+import threading
+import time
+
+import mlb_api
+import scoreboard_data
+
+"""
+Load test the live feed polling loop against mlb_stub_server.py.
+
+Each simulated game runs its own ScoreboardData polling loop on its own
+thread, like one scoreboard per game, and the run reports throughput, latency
+percentiles and failures across all of them.
+
+  >python mlb_stub_server.py --log game.log.gz --latency 50 --jitter 25 --error-rate 0.01
+  >python loadtest.py --url http://localhost:8080/api --games 200 --interval 20 --duration 120
+"""
+
+
+def percentile(values, pct):
+    if len(values) == 0:
+        return 0.0
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+    return values[idx]
+
+
+def poll_game(base_url, game_pk, interval, end_time, latencies, failures, lock):
+    # each thread owns its ScoreboardData; sqlite connections can't cross threads
+    sb_data = scoreboard_data.ScoreboardData(mlb_api.MLB_API(base_url))
+
+    while time.time() < end_time:
+        start = time.perf_counter()
+        try:
+            sb_data.live_data = sb_data.fetch_live_feed(game_pk)
+            elapsed = time.perf_counter() - start
+
+            # a failed fetch comes back as the last good feed, marked stale
+            if sb_data.return_stale_since() is not None:
+                raise mlb_api.MLBAPIError('Served last good data, MLB not answering')
+            with lock:
+                latencies.append(elapsed)
+        except Exception as err:
+            with lock:
+                failures.append(str(err).splitlines()[-1] if str(err) else type(err).__name__)
+            elapsed = time.perf_counter() - start
+
+        time.sleep(max(0.0, interval - elapsed))
+
+
+def run_loadtest(base_url, games, first_game_pk, interval, duration):
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    end_time = time.time() + duration
+
+    threads = []
+    for i in range(games):
+        thread = threading.Thread(target=poll_game, args=(base_url, first_game_pk + i, interval, end_time,
+                                                          latencies, failures, lock), daemon=True)
+        threads.append(thread)
+        thread.start()
+        # spread the first polls across one interval like real scoreboards
+        time.sleep(interval / games)
+
+    for thread in threads:
+        thread.join()
+
+    requests_made = len(latencies) + len(failures)
+    print('Games:       {}'.format(games))
+    print('Requests:    {} ({:.1f}/s)'.format(requests_made, requests_made / duration))
+    print('Failures:    {} ({:.2%})'.format(len(failures), len(failures) / max(requests_made, 1)))
+    print('Latency ms:  p50 {:.1f}  p95 {:.1f}  p99 {:.1f}  max {:.1f}'.format(percentile(latencies, 50) * 1000,
+                                                                              percentile(latencies, 95) * 1000,
+                                                                              percentile(latencies, 99) * 1000,
+                                                                              max(latencies, default=0) * 1000))
+    for failure in sorted(set(failures)):
+        print('  {} x {}'.format(failures.count(failure), failure))
+
+    report = mlb_api.MLB_API.rate_limit_report()
+    if len(report) > 0:
+        print('Rate limit delays:')
+        for line in report:
+            print('  ' + line)
+
+
+##### MAIN #####
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='loadtest')
+    parser.add_argument('--url', required=False, default='http://localhost:8080/api', dest='base_url',
+                        help='Base URL of the stub server')
+    parser.add_argument('--games', required=False, default=100, type=int, dest='games',
+                        help='Number of simulated games')
+    parser.add_argument('--gamepk', required=False, default=900000, type=int, dest='gamepk',
+                        help='First simulated game_pk')
+    parser.add_argument('--interval', required=False, default=20, type=float, dest='interval',
+                        help='Seconds between polls of a game')
+    parser.add_argument('--duration', required=False, default=120, type=float, dest='duration',
+                        help='Seconds to run')
+    args = parser.parse_args()
+
+    run_loadtest(args.base_url, args.games, args.gamepk, args.interval, args.duration)
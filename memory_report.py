@@ -0,0 +1,124 @@
+import argparse
+import datetime
+import gc
+import sys
+import tracemalloc
+
+import config
+import feed_replay
+import mlb_api
+import scoreboard_data
+
+"""
+Report how much memory each game's scoreboard data keeps resident between
+refreshes when one process follows several games, as measured by tracemalloc.
+
+Every game gets its own ScoreboardData sharing one MLB_API.  After each round
+of refreshes the memory still traced to a game's objects is reported, with
+live feed compaction on (the default) or off to compare.
+
+  >python memory_report.py --date 07/04/2024 --refreshes 3
+  >python memory_report.py --replay game.log.gz --no-compact
+"""
+
+
+def traced_size(obj):
+    """
+    Return the bytes of obj and everything reachable from it through dicts
+    and lists that were allocated while tracemalloc was tracing.
+
+    :param obj:
+    :return:
+    """
+    seen = set()
+    pending = [obj]
+    size = 0
+    while len(pending) > 0:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if tracemalloc.get_object_traceback(item) is not None:
+            size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            pending.extend(item)
+    return size
+
+
+def game_pks_for_date(api, game_date):
+    schedule_data = api.fetch_schedule_data(game_date)
+    game_pks = []
+    for date_data in schedule_data.get('dates', []):
+        for game in date_data['games']:
+            game_pks.append(game['gamePk'])
+    return game_pks
+
+
+def run_report(api, game_pks, refreshes, interval, clock):
+    tracemalloc.start()
+    games = {}
+
+    for game_pk in game_pks:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        sb_data = scoreboard_data.ScoreboardData(api)
+        sb_data.refresh_live_data(game_pk)
+        gc.collect()
+        games[game_pk] = [sb_data, tracemalloc.get_traced_memory()[0] - before]
+
+    for i in range(refreshes - 1):
+        clock.sleep(interval)
+        for game_pk in game_pks:
+            games[game_pk][0].refresh_live_data(game_pk)
+    gc.collect()
+
+    print('Live feed: {}, compaction {}'.format(config.SB_CONFIG.get('live_feed', 'full'),
+                                               'on' if config.SB_CONFIG.get('compact_live_data', True) else 'off'))
+    print('{:<10} {:>16} {:>16}'.format('game_pk', 'first load (KB)', 'live_data (KB)'))
+    total = 0
+    for game_pk in game_pks:
+        sb_data, first_load = games[game_pk]
+        size = traced_size(sb_data.live_data)
+        total += size
+        print('{:<10} {:>16,.1f} {:>16,.1f}'.format(game_pk, first_load / 1024, size / 1024))
+
+    current, peak = tracemalloc.get_traced_memory()
+    print('Total live_data:  {:,.1f} KB'.format(total / 1024))
+    print('Traced now:       {:,.1f} KB (peak {:,.1f} KB)'.format(current / 1024, peak / 1024))
+    tracemalloc.stop()
+
+
+##### MAIN #####
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='memory_report')
+    parser.add_argument('--gamepk', required=False, type=int, nargs='+', dest='game_pks',
+                        help='Games to load')
+    parser.add_argument('--date', required=False, default=datetime.datetime.now().strftime('%m/%d/%Y'),
+                        dest='date', help='Load every game on this date (mm/dd/yyyy) if no --gamepk')
+    parser.add_argument('--replay', required=False, dest='replay',
+                        help='Load games from a recorded log instead of MLB')
+    parser.add_argument('--refreshes', required=False, default=1, type=int, dest='refreshes',
+                        help='Refreshes of each game before reporting')
+    parser.add_argument('--interval', required=False, default=20, type=float, dest='interval',
+                        help='Seconds between refreshes')
+    parser.add_argument('--no-compact', required=False, action='store_true', dest='no_compact',
+                        help='Keep the whole live feed between refreshes')
+    args = parser.parse_args()
+
+    if args.no_compact:
+        config.SB_CONFIG['compact_live_data'] = False
+
+    if args.replay is not None:
+        api = feed_replay.MLB_API_Replay(args.replay)
+        clock = api.clock
+        game_pks = args.game_pks if args.game_pks is not None else api.game_pks()
+    else:
+        api = mlb_api.MLB_API()
+        clock = feed_replay.Clock()
+        game_pks = args.game_pks if args.game_pks is not None else game_pks_for_date(api, args.date)
+
+    run_report(api, game_pks, args.refreshes, args.interval, clock)
+    api.close()
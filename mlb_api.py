@@ -1,5 +1,152 @@
 import requests
-import sys
+import requests.adapters
+import json
+import os
+import random
+import re
+import threading
+import time
+import urllib.parse
+
+import config
+import feed_stream
+import json_decoders
+import rate_limiter
+
+
+class MLBAPIError(Exception):
+    pass
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Return the rate limiter shared by every MLB_API in this process, or None
+    if API_CONFIG['rate_limits'] is not set.  Processes share it through its
+    state file.
+
+    :return:
+    """
+    global _rate_limiter
+    if config.API_CONFIG.get('rate_limits') is None:
+        return None
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = rate_limiter.RateLimiter(config.API_CONFIG['rate_limits'],
+                                                     config.API_CONFIG.get('rate_reserve', 0.2),
+                                                     config.API_CONFIG.get('rate_state_file'))
+        return _rate_limiter
+
+
+class CircuitBreaker:
+    """
+    Stops requests to an endpoint after failure_threshold failures in a row.
+    After reset_timeout seconds one trial request is let through: if it works
+    the circuit closes again, if not it stays open for another reset_timeout.
+    """
+
+    failure_threshold = 5
+    reset_timeout = 60.0
+    failures = 0
+    opened_at = None
+    lock = None
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = int(failure_threshold)
+        self.reset_timeout = float(reset_timeout)
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.time() - self.opened_at >= self.reset_timeout:
+                # half-open: let one request through and restart the timer
+                self.opened_at = time.time()
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+
+
+class SingleFlight:
+    """
+    Coalesces requests for the same key across threads.  While a fetch is in
+    flight, later callers wait for it and get the same decoded result, and
+    for window seconds after it finishes they get that result without a new
+    fetch.  One instance is shared by every MLB_API in the process.
+    """
+
+    window = 0.0
+    lock = None
+    in_flight = None
+    recent = None
+
+    def __init__(self, window):
+        self.window = float(window)
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.recent = {}
+
+    def do(self, key, fetch):
+        """
+        Return fetch() for key, sharing the call and its result with any other
+        caller asking for key at about the same time.
+
+        :param key:
+        :param fetch:
+        :return:
+        """
+        with self.lock:
+            now = time.time()
+            if key in self.recent and now - self.recent[key][0] < self.window:
+                return self.recent[key][1]
+
+            flight = self.in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = {'done': threading.Event(), 'result': None, 'error': None}
+                self.in_flight[key] = flight
+
+        if not leader:
+            flight['done'].wait()
+            if flight['error'] is not None:
+                raise flight['error']
+            return flight['result']
+
+        try:
+            flight['result'] = fetch()
+        except Exception as err:
+            flight['error'] = err
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+                if flight['error'] is None and self.window > 0:
+                    now = time.time()
+                    self.recent[key] = (now, flight['result'])
+                    for old_key in [k for k in self.recent if now - self.recent[k][0] >= self.window]:
+                        del self.recent[old_key]
+            flight['done'].set()
+
+        return flight['result']
+
+
+_single_flight = SingleFlight(config.API_CONFIG.get('coalesce_window', 0))
 
 
 class MLB_API:
@@ -9,29 +156,569 @@ class MLB_API:
     API_LINESCORE_URL = API_BASE_URL + "/v1/game/{}/linescore"
     API_PLAYBYPLAY_URL = API_BASE_URL + "/v1/game/{}/playByPlay"
     API_LIVEFEED_URL = API_BASE_URL + "/v1.1/game/{}/feed/live"
+    API_LIVEFEED_FIELDS_URL = API_BASE_URL + "/v1.1/game/{}/feed/live?fields={}"
+    API_LIVEFEED_DIFFPATCH_URL = API_BASE_URL + "/v1.1/game/{}/feed/live/diffPatch?startTimecode={}"
     API_TEAMS_URL = API_BASE_URL + "/v1/teams?sportId=1&activeStatus=ACTIVE"
     API_SCHEDULE_URL = API_BASE_URL + "/v1/schedule?sportId=1&date={}"
     API_SCHEDULE_GAMEPK_URL = API_BASE_URL + "/v1/schedule?sportId=1&gamePk={}"
+    API_SCHEDULE_SLATE_URL = API_BASE_URL + "/v1/schedule?sportId=1&date={}&hydrate=linescore,probablePitcher,team"
     API_PERSON_CURRENT_STATS_URL = API_BASE_URL + "/v1/people/{}/stats/game/current"
 
+    # subtrees of the live feed each consumer reads, as dotted paths of object
+    # keys ('*' matches any key, list levels are not named).  The API's fields=
+    # filter matches on field names at any depth, so every name along a path
+    # has to be requested for the leaf to come back.
+    FEED_PROJECTIONS = {
+        'scoreboard': ['metaData.timeStamp',
+                       'gameData.status.detailedState',
+                       'gameData.datetime.originalDate',
+                       'gameData.datetime.time',
+                       'gameData.datetime.ampm',
+                       'gameData.teams.away.abbreviation',
+                       'gameData.teams.away.record.wins',
+                       'gameData.teams.away.record.losses',
+                       'gameData.teams.home.abbreviation',
+                       'gameData.teams.home.record.wins',
+                       'gameData.teams.home.record.losses',
+                       'gameData.probablePitchers.away.id',
+                       'gameData.probablePitchers.away.fullName',
+                       'gameData.probablePitchers.home.id',
+                       'gameData.probablePitchers.home.fullName',
+                       'liveData.linescore.currentInning',
+                       'liveData.linescore.inningHalf',
+                       'liveData.linescore.inningState',
+                       'liveData.linescore.note',
+                       'liveData.linescore.offense.first.id',
+                       'liveData.linescore.offense.second.id',
+                       'liveData.linescore.offense.third.id',
+                       'liveData.linescore.innings.num',
+                       'liveData.linescore.innings.away.runs',
+                       'liveData.linescore.innings.home.runs',
+                       'liveData.linescore.teams.away.runs',
+                       'liveData.linescore.teams.away.hits',
+                       'liveData.linescore.teams.away.errors',
+                       'liveData.linescore.teams.home.runs',
+                       'liveData.linescore.teams.home.hits',
+                       'liveData.linescore.teams.home.errors',
+                       'liveData.plays.currentPlay.atBatIndex',
+                       'liveData.plays.currentPlay.result.event',
+                       'liveData.plays.currentPlay.result.description',
+                       'liveData.plays.currentPlay.about.inning',
+                       'liveData.plays.currentPlay.about.halfInning',
+                       'liveData.plays.currentPlay.about.isComplete',
+                       'liveData.plays.currentPlay.count.balls',
+                       'liveData.plays.currentPlay.count.strikes',
+                       'liveData.plays.currentPlay.count.outs',
+                       'liveData.plays.currentPlay.matchup.batter.id',
+                       'liveData.plays.currentPlay.matchup.batter.fullName',
+                       'liveData.plays.currentPlay.matchup.pitcher.id',
+                       'liveData.plays.currentPlay.matchup.pitcher.fullName',
+                       'liveData.plays.currentPlay.playEvents.pitchNumber',
+                       'liveData.plays.currentPlay.playEvents.isPitch',
+                       'liveData.plays.currentPlay.playEvents.details.description',
+                       'liveData.plays.currentPlay.playEvents.details.type.description',
+                       'liveData.plays.currentPlay.playEvents.pitchData.startSpeed',
+                       'liveData.plays.allPlays.atBatIndex',
+                       'liveData.plays.allPlays.result.event',
+                       'liveData.plays.allPlays.result.description',
+                       'liveData.plays.allPlays.about.inning',
+                       'liveData.plays.allPlays.about.halfInning',
+                       'liveData.plays.allPlays.about.isComplete',
+                       'liveData.plays.allPlays.about.isScoringPlay',
+                       'liveData.plays.allPlays.matchup.batter.id',
+                       'liveData.plays.allPlays.matchup.pitcher.id',
+                       'liveData.plays.allPlays.playEvents.isPitch',
+                       'liveData.plays.allPlays.playEvents.pitchNumber',
+                       'liveData.plays.allPlays.playEvents.details.description',
+                       'liveData.plays.allPlays.playEvents.details.type.description',
+                       'liveData.plays.allPlays.playEvents.isSubstitution',
+                       'liveData.plays.allPlays.playEvents.player.id',
+                       'liveData.plays.allPlays.playEvents.replacedPlayer.id',
+                       'liveData.plays.allPlays.playEvents.playerReplaced.id',
+                       'liveData.plays.playsByInning.top',
+                       'liveData.plays.playsByInning.bottom',
+                       'liveData.boxscore.teams.away.team.id',
+                       'liveData.boxscore.teams.away.battingOrder',
+                       'liveData.boxscore.teams.away.players.*.person.id',
+                       'liveData.boxscore.teams.away.players.*.person.fullName',
+                       'liveData.boxscore.teams.away.players.*.jerseyNumber',
+                       'liveData.boxscore.teams.away.players.*.battingOrder',
+                       'liveData.boxscore.teams.away.players.*.stats.batting.hits',
+                       'liveData.boxscore.teams.away.players.*.stats.batting.atBats',
+                       'liveData.boxscore.teams.away.players.*.seasonStats.batting.avg',
+                       'liveData.boxscore.teams.away.players.*.seasonStats.pitching.era',
+                       'liveData.boxscore.teams.away.players.*.seasonStats.pitching.wins',
+                       'liveData.boxscore.teams.away.players.*.seasonStats.pitching.losses',
+                       'liveData.boxscore.teams.home.team.id',
+                       'liveData.boxscore.teams.home.battingOrder',
+                       'liveData.boxscore.teams.home.players.*.person.id',
+                       'liveData.boxscore.teams.home.players.*.person.fullName',
+                       'liveData.boxscore.teams.home.players.*.jerseyNumber',
+                       'liveData.boxscore.teams.home.players.*.battingOrder',
+                       'liveData.boxscore.teams.home.players.*.stats.batting.hits',
+                       'liveData.boxscore.teams.home.players.*.stats.batting.atBats',
+                       'liveData.boxscore.teams.home.players.*.seasonStats.batting.avg',
+                       'liveData.boxscore.teams.home.players.*.seasonStats.pitching.era',
+                       'liveData.boxscore.teams.home.players.*.seasonStats.pitching.wins',
+                       'liveData.boxscore.teams.home.players.*.seasonStats.pitching.losses',
+                       'liveData.decisions.winner.id',
+                       'liveData.decisions.winner.fullName',
+                       'liveData.decisions.loser.id',
+                       'liveData.decisions.loser.fullName'],
+        'tile': ['metaData.timeStamp',
+                 'gameData.status.detailedState',
+                 'gameData.datetime.time',
+                 'gameData.datetime.ampm',
+                 'gameData.teams.away.abbreviation',
+                 'gameData.teams.home.abbreviation',
+                 'liveData.linescore.currentInning',
+                 'liveData.linescore.currentInningOrdinal',
+                 'liveData.linescore.inningState',
+                 'liveData.linescore.outs',
+                 'liveData.linescore.innings.num',
+                 'liveData.linescore.innings.away.runs',
+                 'liveData.linescore.innings.home.runs',
+                 'liveData.linescore.teams.away.runs',
+                 'liveData.linescore.teams.away.hits',
+                 'liveData.linescore.teams.away.errors',
+                 'liveData.linescore.teams.home.runs',
+                 'liveData.linescore.teams.home.hits',
+                 'liveData.linescore.teams.home.errors'],
+        'due_up': ['metaData.timeStamp',
+                   'gameData.status.detailedState',
+                   'liveData.linescore.currentInning',
+                   'liveData.linescore.inningHalf',
+                   'liveData.linescore.inningState',
+                   'liveData.plays.currentPlay.count.outs',
+                   'liveData.plays.allPlays.matchup.batter.id',
+                   'liveData.plays.allPlays.playEvents.isSubstitution',
+                   'liveData.plays.allPlays.playEvents.player.id',
+                   'liveData.plays.allPlays.playEvents.replacedPlayer.id',
+                   'liveData.plays.allPlays.playEvents.playerReplaced.id',
+                   'liveData.plays.playsByInning.top',
+                   'liveData.plays.playsByInning.bottom',
+                   'liveData.boxscore.teams.away.battingOrder',
+                   'liveData.boxscore.teams.away.players.*.person.id',
+                   'liveData.boxscore.teams.away.players.*.person.fullName',
+                   'liveData.boxscore.teams.away.players.*.stats.batting.hits',
+                   'liveData.boxscore.teams.away.players.*.stats.batting.atBats',
+                   'liveData.boxscore.teams.away.players.*.seasonStats.batting.avg',
+                   'liveData.boxscore.teams.home.battingOrder',
+                   'liveData.boxscore.teams.home.players.*.person.id',
+                   'liveData.boxscore.teams.home.players.*.person.fullName',
+                   'liveData.boxscore.teams.home.players.*.stats.batting.hits',
+                   'liveData.boxscore.teams.home.players.*.stats.batting.atBats',
+                   'liveData.boxscore.teams.home.players.*.seasonStats.batting.avg']
+    }
+
+    session = None
+    timeout = None
+    cache = None
+    cache_file = None
+    cache_lock = None
+    recorder = None
+    decode = None
+    breakers = None
+    last_good = None
+    stale = None
+
+    def __init__(self, base_url=None, recorder=None):
+        if base_url is None:
+            base_url = config.API_CONFIG.get('base_url')
+        if base_url is not None and base_url != self.API_BASE_URL:
+            self.set_base_url(base_url)
+
+        self.timeout = (float(config.API_CONFIG['connect_timeout']), float(config.API_CONFIG['read_timeout']))
+        self.decode = json_decoders.get_decoder(config.API_CONFIG.get('json_decoder', 'auto'))
+        self.session = self.get_session()
+        self.cache_file = config.API_CONFIG.get('cache_file')
+        self.cache = self.load_cache()
+        self.cache_lock = threading.Lock()
+        self.breakers = {}
+        self.last_good = {}
+        self.stale = {}
+        self.recorder = recorder
+
+    def set_base_url(self, base_url):
+        """
+        Point this API object at another server with the same URL layout as
+        statsapi.mlb.com, e.g. the local stand-in in mlb_stub_server.py.
+
+        :param base_url: replacement for API_BASE_URL, e.g. http://localhost:8080/api
+        :return:
+        """
+        base_url = base_url.rstrip('/')
+        for name in dir(type(self)):
+            if name.startswith('API_') and name.endswith('_URL') and name != 'API_BASE_URL':
+                setattr(self, name, getattr(type(self), name).replace(type(self).API_BASE_URL, base_url, 1))
+        self.API_BASE_URL = base_url
+
+    def get_session(self):
+        """
+        Return the pooled HTTP session used for every request.  Connections to
+        statsapi.mlb.com are kept alive between polls so a refresh does not pay
+        for a new TCP connection and DNS lookup each time.
+
+        :return:
+        """
+        if self.session is None:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=int(config.API_CONFIG['pool_connections']),
+                                                    pool_maxsize=int(config.API_CONFIG['pool_maxsize']))
+            self.session = requests.Session()
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self.session.headers.update({'Accept': 'application/json',
+                                         'Accept-Encoding': 'gzip, deflate',
+                                         'Connection': 'keep-alive'})
+        return self.session
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    @staticmethod
+    def cache_ttl(endpoint):
+        return int(config.API_CONFIG.get('cache_ttl', {}).get(endpoint, 0))
+
+    def load_cache(self):
+        """
+        Load cached responses kept on disk by a previous run.
+
+        :return:
+        """
+        cache = {}
+        if self.cache_file is not None and os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+        return cache
+
+    def save_cache(self):
+        if self.cache_file is None:
+            return
+
+        # write to a temp file first so a crash never leaves a half-written cache
+        tmp_file = '{}.{}.{}.tmp'.format(self.cache_file, os.getpid(), threading.get_ident())
+        try:
+            with self.cache_lock:
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.cache, f)
+                os.replace(tmp_file, self.cache_file)
+        except OSError as err:
+            print('Cache write error: {}'.format(err))
+
+    @staticmethod
+    def endpoint_name(url):
+        # ids and dates in the path all belong to the same endpoint
+        return re.sub(r'/\d+(?=/|$)', '/{}', urllib.parse.urlparse(url).path)
+
+    def get_breaker(self, url):
+        endpoint = self.endpoint_name(url)
+        with self.cache_lock:
+            if endpoint not in self.breakers:
+                self.breakers[endpoint] = CircuitBreaker(config.API_CONFIG.get('breaker_failures', 5),
+                                                         config.API_CONFIG.get('breaker_reset', 60))
+            return self.breakers[endpoint]
+
+    @staticmethod
+    def rate_limit_lane(url):
+        """
+        Return the rate limit bucket and priority for url.  Live feed polls go
+        ahead of everything else.
+
+        :param url:
+        :return:
+        """
+        path = urllib.parse.urlparse(url).path
+        if '/feed/live' in path:
+            return 'live_feed', rate_limiter.HIGH
+        if path.endswith('/schedule'):
+            return 'schedule', rate_limiter.LOW
+        if path.endswith('/teams'):
+            return 'teams', rate_limiter.LOW
+        return 'default', rate_limiter.LOW
+
+    @staticmethod
+    def rate_limit_report():
+        limiter = get_rate_limiter()
+        if limiter is None:
+            return []
+        return limiter.report()
+
+    @staticmethod
+    def backoff_delay(attempt):
+        # exponential backoff with jitter so many scoreboards don't retry in step
+        delay = float(config.API_CONFIG.get('backoff', 0.5)) * (2 ** (attempt - 1))
+        delay = min(delay, float(config.API_CONFIG.get('backoff_max', 8)))
+        return delay * random.uniform(0.5, 1.5)
+
+    def request(self, url, headers=None, stream=False):
+        """
+        GET url, retrying connection errors, 5xx and 429 responses with
+        backoff.  Raises MLBAPIError when all attempts fail, on any other
+        error response, or while the endpoint's circuit breaker is open.
+        Every attempt first waits for the host-wide rate limiter.
+
+        :param url:
+        :param headers:
+        :param stream:
+        :return: the response
+        """
+        breaker = self.get_breaker(url)
+        limiter = get_rate_limiter()
+        bucket, priority = self.rate_limit_lane(url)
+        attempts = int(config.API_CONFIG.get('retries', 3)) + 1
+        error = None
+
+        for attempt in range(attempts):
+            if not breaker.allow():
+                raise MLBAPIError('MLB requests to {} are suspended after repeated errors. {}'
+                                  .format(self.endpoint_name(url), error or ''))
+            if attempt > 0:
+                time.sleep(self.backoff_delay(attempt))
+            if limiter is not None:
+                limiter.acquire(bucket, priority)
+
+            try:
+                response = self.get_session().get(url, headers=headers, timeout=self.timeout, stream=stream)
+            except requests.RequestException as err:
+                breaker.record_failure()
+                error = err
+                continue
+
+            if response.status_code >= 500 or response.status_code == 429:
+                breaker.record_failure()
+                error = 'HTTP {} from {}'.format(response.status_code, url)
+                response.close()
+                continue
+
+            if response.status_code >= 400:
+                response.close()
+                raise MLBAPIError('HTTP {} from {}'.format(response.status_code, url))
+
+            breaker.record_success()
+            return response
+
+        raise MLBAPIError('No response from MLB after {} attempts. {}'.format(attempts, error))
+
     @staticmethod
-    def fetch_data(url):
+    def stale_key(url):
+        # a game's feed, projections and patches go stale and recover together
+        match = re.search(r'/game/(\d+)/', url)
+        if match is not None:
+            return 'game/{}'.format(match.group(1))
+        return url
+
+    def fetch_succeeded(self, url, results, fallback):
+        with self.cache_lock:
+            if fallback:
+                self.last_good[url] = results
+            self.stale.pop(self.stale_key(url), None)
+
+    def fetch_failed(self, url, err, fallback):
+        """
+        Return the last good response for url so the scoreboard keeps showing
+        data while MLB recovers, or raise MLBAPIError if there is none.
+
+        :param url:
+        :param err:
+        :param fallback:
+        :return:
+        """
+        with self.cache_lock:
+            if fallback and url in self.last_good:
+                self.stale.setdefault(self.stale_key(url), time.time())
+                return self.last_good[url]
+        raise MLBAPIError('An error occurred retrieving data from MLB.\n{}'.format(err))
+
+    def stale_since(self, url):
+        """
+        Return when url started being served from its last good response, or
+        None if its data is current.  Every url of a game counts as one: a
+        successful fetch of the game's feed, a projection of it or a patch
+        makes all of them current again.
+
+        :param url:
+        :return:
+        """
+        with self.cache_lock:
+            return self.stale.get(self.stale_key(url))
+
+    def replace_last_good(self, data, compact_data):
+        """
+        Keep compact_data instead of data as the last good response, so a
+        compacted feed doesn't leave the full one resident.
+
+        :param data:
+        :param compact_data:
+        :return:
+        """
+        with self.cache_lock:
+            for url in self.last_good:
+                if self.last_good[url] is data:
+                    self.last_good[url] = compact_data
+
+    def fetch_data(self, url, ttl=0, fallback=True):
+        """
+        Fetch and decode url.  Requests for the same url made at about the
+        same time anywhere in this process share one fetch and one decoded
+        result (see SingleFlight), so callers must not modify it.
+
+        When ttl is greater than zero the response is cached: it is returned
+        without a request for ttl seconds, and after that it is revalidated
+        with its ETag/Last-Modified so an unchanged response comes back as a
+        304 instead of a full download.
+
+        If MLB can't be reached the last good response is returned instead
+        (see fetch_failed) unless fallback is False.
+
+        :param url:
+        :param ttl: seconds the response may be served from the cache
+        :param fallback: serve the last good response on errors
+        :return:
+        """
+        return _single_flight.do(url, lambda: self.fetch_url(url, ttl, fallback))
+
+    def fetch_url(self, url, ttl, fallback):
+        entry = None
+        if ttl > 0:
+            with self.cache_lock:
+                entry = self.cache.get(url)
+
+        if entry is not None and time.time() - entry['time'] < ttl:
+            if self.recorder is not None:
+                self.recorder.record(url, entry['data'])
+            return entry['data']
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
         try:
-            results = requests.get(url).json()
+            response = self.request(url, headers)
+            if response.status_code == 304 and entry is not None:
+                results = entry['data']
+            else:
+                results = self.decode(response.content)
         except Exception as err:
-            sys.exit('An unhandled exception occurred retrieving data from MLB.\n{}'.format(err))
+            if entry is not None and fallback:
+                with self.cache_lock:
+                    self.last_good.setdefault(url, entry['data'])
+            return self.fetch_failed(url, err, fallback)
+
+        self.fetch_succeeded(url, results, fallback)
+
+        if ttl > 0 and response.ok:
+            if entry is None:
+                entry = {}
+            with self.cache_lock:
+                self.cache[url] = {'time': time.time(),
+                                   'etag': response.headers.get('ETag', entry.get('etag')),
+                                   'last_modified': response.headers.get('Last-Modified', entry.get('last_modified')),
+                                   'data': results}
+            self.save_cache()
+
+        if self.recorder is not None:
+            self.recorder.record(url, results)
+
         return results
 
     def fetch_teams_data(self):
-        team_data = self.fetch_data(self.API_TEAMS_URL)['teams']
+        team_data = self.fetch_data(self.API_TEAMS_URL, self.cache_ttl('teams'))['teams']
         return team_data
 
     def fetch_schedule_data(self, game_date):
-        schedule_data = self.fetch_data(self.API_SCHEDULE_URL.format(game_date))
+        schedule_data = self.fetch_data(self.API_SCHEDULE_URL.format(game_date), self.cache_ttl('schedule'))
         return schedule_data
 
-    def fetch_live_feed_data(self, game_pk):
-        live_data = self.fetch_data(self.API_LIVEFEED_URL.format(game_pk))
+    def fetch_slate_data(self, game_date):
+        """
+        Fetch the schedule for game_date with every game's linescore, status,
+        teams and probable pitchers filled in, i.e. the whole slate in one
+        request.
+
+        :param game_date: MM/DD/YYYY
+        :return:
+        """
+        slate_data = self.fetch_data(self.API_SCHEDULE_SLATE_URL.format(game_date), self.cache_ttl('slate'))
+        return slate_data
+
+    def fetch_person_stats_data(self, person_id):
+        stats_data = self.fetch_data(self.API_PERSON_CURRENT_STATS_URL.format(person_id))
+        return stats_data
+
+    @classmethod
+    def build_fields(cls, projection):
+        """
+        Return the fields= value for a projection in FEED_PROJECTIONS.
+
+        :param projection:
+        :return:
+        """
+        fields = []
+        for path in cls.FEED_PROJECTIONS[projection]:
+            for name in path.split('.'):
+                if name != '*' and name not in fields:
+                    fields.append(name)
+        return ','.join(fields)
+
+    def fetch_live_feed_data(self, game_pk, projection=None):
+        if projection is None:
+            url = self.API_LIVEFEED_URL.format(game_pk)
+        else:
+            url = self.API_LIVEFEED_FIELDS_URL.format(game_pk, self.build_fields(projection))
+        live_data = self.fetch_data(url, self.cache_ttl('live_feed'))
         return live_data
 
+    def fetch_streamed_data(self, url, paths):
+        """
+        Fetch url and decode only the subtrees selected by paths while the
+        response streams in, see feed_stream.py.  Coalesced like fetch_data.
+
+        :param url:
+        :param paths: dotted paths as in FEED_PROJECTIONS
+        :return:
+        """
+        return _single_flight.do((url, tuple(paths)), lambda: self.stream_url(url, paths))
+
+    def stream_url(self, url, paths):
+        try:
+            with self.request(url, stream=True) as response:
+                response.raw.decode_content = True
+                results = feed_stream.extract(response.raw, feed_stream.build_path_tree(paths))
+        except Exception as err:
+            return self.fetch_failed(url, err, True)
+
+        self.fetch_succeeded(url, results, True)
+
+        if self.recorder is not None:
+            self.recorder.record(url, results)
+
+        return results
+
+    def fetch_live_feed_streamed(self, game_pk, projection):
+        live_data = self.fetch_streamed_data(self.API_LIVEFEED_URL.format(game_pk), self.FEED_PROJECTIONS[projection])
+        return live_data
+
+    def fetch_live_feed_patch(self, game_pk, start_timecode):
+        """
+        Return the changes to the live feed since start_timecode (the feed's
+        metaData.timeStamp).  MLB answers with a list of {'diff': [operations]}
+        JSON patches, or with the complete live feed if it decides the patch
+        chain would be larger than the feed itself.
+
+        :param game_pk:
+        :param start_timecode:
+        :return:
+        """
+        patch_data = self.fetch_data(self.API_LIVEFEED_DIFFPATCH_URL.format(game_pk, start_timecode),
+                                     fallback=False)
+        return patch_data
+
 # <SDG><
\ No newline at end of file
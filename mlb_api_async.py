@@ -0,0 +1,76 @@
+import asyncio
+import concurrent.futures
+import functools
+
+import config
+import mlb_api
+
+
+class MLB_API_Async:
+    """
+    asyncio counterpart to MLB_API.  Requests run on a bounded worker pool that
+    shares one MLB_API (and so one keep-alive connection pool and response
+    cache), which lets a whole slate of games be refreshed in about the time of
+    a single request:
+
+        api = MLB_API_Async()
+        feeds = asyncio.run(api.fetch_live_feeds([565997, 566001, 566010]))
+    """
+
+    api = None
+    executor = None
+    semaphore = None
+    max_concurrency = 0
+
+    def __init__(self, api=None, max_concurrency=None):
+        self.api = api if api is not None else mlb_api.MLB_API()
+        if max_concurrency is None:
+            max_concurrency = config.API_CONFIG['max_concurrency']
+        self.max_concurrency = int(max_concurrency)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                              thread_name_prefix='mlb_api')
+
+    async def call(self, func, *args):
+        # the semaphore belongs to the running event loop, so create it on first use
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    async def fetch_teams_data(self):
+        return await self.call(self.api.fetch_teams_data)
+
+    async def fetch_schedule_data(self, game_date):
+        return await self.call(self.api.fetch_schedule_data, game_date)
+
+    async def fetch_slate_data(self, game_date):
+        return await self.call(self.api.fetch_slate_data, game_date)
+
+    async def fetch_live_feed_data(self, game_pk, projection=None):
+        return await self.call(self.api.fetch_live_feed_data, game_pk, projection)
+
+    async def fetch_live_feed_patch(self, game_pk, start_timecode):
+        return await self.call(self.api.fetch_live_feed_patch, game_pk, start_timecode)
+
+    async def fetch_person_stats_data(self, person_id):
+        return await self.call(self.api.fetch_person_stats_data, person_id)
+
+    async def fetch_live_feeds(self, game_pks, projection=None):
+        """
+        Fetch the live feed of every game in game_pks concurrently.  Returns a
+        dict of game_pk to feed; a game whose fetch failed maps to the exception
+        so one bad game does not lose the rest of the slate.
+
+        :param game_pks:
+        :param projection:
+        :return:
+        """
+        results = await asyncio.gather(*[self.fetch_live_feed_data(game_pk, projection) for game_pk in game_pks],
+                                       return_exceptions=True)
+        return dict(zip(game_pks, results))
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.api.close()
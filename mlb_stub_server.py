@@ -0,0 +1,209 @@
+import argparse
+import http.server
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+
+import feed_replay
+
+"""
+Local stand-in for statsapi.mlb.com, for load testing the polling loop.
+
+The server answers the URLs MLB_API builds from a log recorded with
+MLB-live-scoreboard3.py --record.  Every game_pk is served: games in the log
+play back their own recorded feeds, and any other game_pk plays back the
+first recorded game under that game_pk, so hundreds of simulated games can be
+polled from one short recording.  Each request for a game's feed moves that
+game one recorded state forward.
+
+  >python mlb_stub_server.py --log game.log.gz --port 8080 --latency 50 --jitter 20 --error-rate 0.01
+
+and point the scoreboard at it with API_CONFIG['base_url'] = 'http://localhost:8080/api'.
+"""
+
+TEAMS_RE = re.compile(r'^/api/v1/teams$')
+SCHEDULE_RE = re.compile(r'^/api/v1/schedule$')
+LIVEFEED_RE = re.compile(r'^/api/v1\.1/game/(\d+)/feed/live(/diffPatch)?$')
+PERSON_STATS_RE = re.compile(r'^/api/v1/people/(\d+)/stats/game/current$')
+
+
+class StubData:
+    """
+    Responses served by the stub, built once from a recorded log.
+    """
+
+    teams = None
+    schedule = None
+    feeds = None
+    default_game_pk = None
+    positions = None
+    lock = None
+
+    def __init__(self, log_file):
+        self.teams = {'teams': []}
+        self.schedule = {'totalGames': 0, 'dates': []}
+        self.feeds = {}
+        self.positions = {}
+        self.lock = threading.Lock()
+
+        records = feed_replay.read_log(log_file)
+        for record in records:
+            path = urllib.parse.urlparse(record['url']).path
+            path = path[path.find('/api/'):]
+
+            if TEAMS_RE.match(path):
+                self.teams = record['data']
+            elif SCHEDULE_RE.match(path):
+                self.schedule = record['data']
+
+        self.feeds = feed_replay.rebuild_feeds(records)
+        if len(self.feeds) > 0:
+            self.default_game_pk = list(self.feeds.keys())[0]
+
+    def next_feed(self, game_pk):
+        """
+        Return the next recorded state of game_pk's live feed, holding on the
+        last state once the recording is used up.
+
+        :param game_pk:
+        :return:
+        """
+        states = self.feeds.get(game_pk, self.feeds.get(self.default_game_pk))
+        if states is None:
+            return None
+
+        with self.lock:
+            position = self.positions.get(game_pk, 0)
+            self.positions[game_pk] = min(position + 1, len(states) - 1)
+
+        live_data = states[position]
+        if game_pk not in self.feeds:
+            live_data = dict(live_data, gamePk=game_pk)
+        return live_data
+
+
+class TokenBucket:
+    rate = 0.0
+    tokens = 0.0
+    last = 0.0
+    lock = None
+
+    def __init__(self, rate):
+        self.rate = float(rate)
+        self.tokens = self.rate
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(max(self.rate, 1.0), self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StubRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    # set on the class by run_server()
+    stub_data = None
+    latency = 0.0
+    jitter = 0.0
+    error_rate = 0.0
+    throttle = None
+
+    def do_GET(self):
+        path = urllib.parse.urlparse(self.path).path
+
+        # simulated network and server behavior
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if self.throttle is not None and not self.throttle.take():
+            self.send_json(429, {'message': 'Too Many Requests'})
+            return
+        if self.error_rate > 0 and random.random() < self.error_rate:
+            self.send_json(500, {'message': 'Simulated server error'})
+            return
+
+        match = LIVEFEED_RE.match(path)
+        data = None
+        if TEAMS_RE.match(path):
+            data = self.stub_data.teams
+        elif SCHEDULE_RE.match(path):
+            data = self.stub_data.schedule
+        elif match is not None:
+            # a diffPatch request is answered with the whole feed, as MLB does
+            # when the patch chain would be too long
+            data = self.stub_data.next_feed(int(match.group(1)))
+        elif PERSON_STATS_RE.match(path):
+            data = {'stats': []}
+
+        if data is None:
+            self.send_json(404, {'message': 'Not found: {}'.format(path)})
+        else:
+            self.send_json(200, data)
+
+    def send_json(self, status, data):
+        body = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # keep the console quiet under load
+        pass
+
+
+def run_server(log_file, port=8080, latency_ms=0, jitter_ms=0, error_rate=0.0, rate_limit=0):
+    """
+    Serve recorded MLB data on localhost until interrupted.
+
+    :param log_file: log recorded with --record
+    :param port:
+    :param latency_ms: added to every response
+    :param jitter_ms: random +/- variation of the latency
+    :param error_rate: fraction of requests answered with a 500
+    :param rate_limit: requests per second before answering 429 (0 = unlimited)
+    :return:
+    """
+    StubRequestHandler.stub_data = StubData(log_file)
+    StubRequestHandler.latency = latency_ms / 1000.0
+    StubRequestHandler.jitter = jitter_ms / 1000.0
+    StubRequestHandler.error_rate = error_rate
+    StubRequestHandler.throttle = TokenBucket(rate_limit) if rate_limit > 0 else None
+
+    server = http.server.ThreadingHTTPServer(('localhost', port), StubRequestHandler)
+    server.daemon_threads = True
+    print('Serving {} on http://localhost:{}/api'.format(log_file, port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+
+
+##### MAIN #####
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='mlb_stub_server')
+    parser.add_argument('--log', required=True, dest='log_file', help='Log recorded with --record')
+    parser.add_argument('--port', required=False, default=8080, type=int, dest='port')
+    parser.add_argument('--latency', required=False, default=0, type=float, dest='latency',
+                        help='Added latency in ms')
+    parser.add_argument('--jitter', required=False, default=0, type=float, dest='jitter',
+                        help='Random +/- latency variation in ms')
+    parser.add_argument('--error-rate', required=False, default=0.0, type=float, dest='error_rate',
+                        help='Fraction of requests that fail with a 500')
+    parser.add_argument('--rate-limit', required=False, default=0, type=float, dest='rate_limit',
+                        help='Requests per second before answering 429')
+    args = parser.parse_args()
+
+    run_server(args.log_file, args.port, args.latency, args.jitter, args.error_rate, args.rate_limit)
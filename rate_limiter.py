@@ -0,0 +1,194 @@
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+"""
+Token bucket rate limiting of MLB requests, shared by every MLB_API on a host.
+
+Each endpoint has its own bucket and all requests also draw from the total
+budget.  Requests are either high priority (live feeds) or low priority
+(schedule, teams, ...).  The total budget is split in two buckets: 'total'
+gets the rate less the reserve and is open to every request, 'reserve' gets
+the reserved share and only high priority requests may draw from it.  High
+priority requests use the reserve first, so a burst of schedule lookups that
+empties 'total' never delays a live feed poll.
+
+The buckets live in a small JSON file locked with flock (or msvcrt on
+Windows), so scoreboards running as separate processes share one budget.
+Without file locking support the limit is only shared between threads.  Every
+acquire locks, reads and rewrites that file, which costs about 0.2 ms, small
+next to the tens of milliseconds of the request it lets through.
+"""
+
+HIGH = 'high'
+LOW = 'low'
+
+
+class RateLimiter:
+    rates = None
+    reserve = 0.0
+    state_file = None
+    lock = None
+    delays = None
+
+    def __init__(self, rates, reserve=0.2, state_file=None):
+        """
+        :param rates: requests per second for 'total' and each endpoint, plus 'default';
+                      None leaves that one unlimited
+        :param reserve: fraction of the total budget kept for high priority requests
+        :param state_file: file shared by all processes, None for the temp directory
+        """
+        self.rates = dict(rates)
+        self.reserve = float(reserve)
+        if not 0.0 <= self.reserve < 1.0:
+            raise ValueError('Rate reserve must be at least 0 and less than 1, not {}'.format(reserve))
+        if state_file is None:
+            state_file = os.path.join(tempfile.gettempdir(), 'mlb_api_rate_limits.json')
+        self.state_file = state_file
+        self.lock = threading.Lock()
+        self.delays = {}
+
+    def rate(self, bucket):
+        # None means the bucket is not limited
+        if bucket in ['total', 'reserve']:
+            rate = self.rates.get('total')
+            if rate is None:
+                return None
+            share = self.reserve if bucket == 'reserve' else 1.0 - self.reserve
+            return float(rate) * share
+        rate = self.rates.get(bucket, self.rates.get('default', 1))
+        return float(rate) if rate is not None else None
+
+    def capacity(self, bucket):
+        # a bucket holds at most one second of requests
+        return max(self.rate(bucket), 1.0)
+
+    @contextlib.contextmanager
+    def locked_state(self):
+        """
+        Yield the bucket state dict while holding the thread and file locks,
+        and write it back afterwards.
+        """
+        with self.lock:
+            with open(self.state_file, 'a+') as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                elif msvcrt is not None:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read() or '{}')
+                    except ValueError:
+                        state = {}
+
+                    yield state
+
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                    elif msvcrt is not None:
+                        f.seek(0)
+                        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def refill(self, state, bucket, now):
+        capacity = self.capacity(bucket)
+        tokens, last = state.get(bucket, [capacity, now])
+        tokens = min(capacity, tokens + (now - last) * self.rate(bucket))
+        state[bucket] = [tokens, now]
+        return tokens
+
+    def try_acquire(self, endpoint, priority):
+        """
+        Take a token for endpoint if there is one.
+
+        :param endpoint:
+        :param priority:
+        :return: 0 if a token was taken, otherwise seconds to wait before trying again
+        """
+        with self.locked_state() as state:
+            now = time.time()
+            wait = 0.0
+
+            endpoint_limited = self.rate(endpoint) is not None
+            if endpoint_limited:
+                tokens = self.refill(state, endpoint, now)
+                if tokens < 1.0:
+                    wait = (1.0 - tokens) / self.rate(endpoint)
+
+            # high priority requests take from the reserve first, low priority
+            # requests never do
+            total_bucket = None
+            if self.rate('total') is not None:
+                total_waits = []
+                for bucket in ['reserve', 'total'] if priority == HIGH else ['total']:
+                    if self.rate(bucket) <= 0:
+                        continue
+                    tokens = self.refill(state, bucket, now)
+                    if tokens >= 1.0:
+                        total_bucket = bucket
+                        break
+                    total_waits.append((1.0 - tokens) / self.rate(bucket))
+                if total_bucket is None:
+                    wait = max(wait, min(total_waits))
+
+            if wait > 0:
+                return max(wait, 0.001)
+
+            if endpoint_limited:
+                state[endpoint][0] -= 1.0
+            if total_bucket is not None:
+                state[total_bucket][0] -= 1.0
+            return 0
+
+    def acquire(self, endpoint, priority=LOW):
+        """
+        Wait until a request to endpoint is allowed.
+
+        :param endpoint:
+        :param priority: HIGH or LOW
+        :return: seconds the request was delayed
+        """
+        start = time.time()
+        wait = self.try_acquire(endpoint, priority)
+        while wait > 0:
+            time.sleep(min(wait, 1.0))
+            wait = self.try_acquire(endpoint, priority)
+
+        delayed = time.time() - start
+        with self.lock:
+            count, total, longest = self.delays.get(endpoint, [0, 0.0, 0.0])
+            self.delays[endpoint] = [count + 1, total + delayed, max(longest, delayed)]
+        return delayed
+
+    def report(self):
+        """
+        Return lines describing how long requests were delayed, per endpoint.
+
+        :return:
+        """
+        lines = []
+        with self.lock:
+            for endpoint in sorted(self.delays):
+                count, total, longest = self.delays[endpoint]
+                lines.append('{:<12} {:>6} requests, avg delay {:.3f}s, max delay {:.3f}s'
+                             .format(endpoint, count, total / count, longest))
+        return lines
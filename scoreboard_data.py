@@ -1,46 +1,83 @@
 import database
+import feed_stream
+import game_events
+import game_snapshot
 import mlb_api
-import os
+import json_patch
+import config
+import sys
+import threading
 import datetime
 
+# live feeds are shared between viewers of the same game (see MLB_API.fetch_data),
+# so patches are applied to them under one lock
+_live_feed_lock = threading.Lock()
+
+# what is kept of a live feed between refreshes: the fields the scoreboard
+# reads, less the play-by-play the play log has already taken in
+_retained_paths = [path for path in mlb_api.MLB_API.FEED_PROJECTIONS['scoreboard']
+                   if not path.startswith('liveData.plays.allPlays.playEvents') and
+                   not path.startswith('liveData.plays.playsByInning')]
+_retained_tree = feed_stream.build_path_tree(_retained_paths)
+
 
 class ScoreboardData:
     scoreboard_db = None
     api = None
-    #db_file = 'MLB-live-scoreboard.db'
     db_file = ':memory:'
     live_data = None
+    live_data_game_pk = None
+    live_data_stale_since = None
+    snapshot = None
+    team_index = None
+    player_index = None
+    play_log = None
+    play_log_game_pk = None
+    play_cursor = None
+    last_batter_ids = None
+    pitch_counts = None
+    scoring_plays = None
+    last_logged_play = None
+    batting_orders = None
+    lineup_slots = None
+    compacted_feed = None
+    compacted_plays = 0
+    subscribers = None
+    new_events = None
+    events = None
+    slate = None
 
     table_status = 'status'
     table_game = 'game'
     table_players = 'players'
     table_teams = 'teams'
 
-    def __init__(self):
+    def __init__(self, api=None):
 
-        # delete old db file
-        if os.path.exists(self.db_file):
-            os.remove(self.db_file)
-
-        # create new database and API objects
+        # create new database and API objects; a database file is reused
+        self.db_file = config.SB_CONFIG.get('db_file', ':memory:')
         self.scoreboard_db = database.Database(self.db_file)
-        self.api = mlb_api.MLB_API()
+        self.api = api if api is not None else mlb_api.MLB_API()
+        self.snapshot = game_snapshot.GameSnapshot()
+        self.subscribers = []
+        self.events = []
 
         # create database tables and load non-game specific tables
         self.create_scoreboard_db_tables()
         self.load_all_mlb_teams()
 
     def create_scoreboard_db_tables(self):
-        STATS = '''CREATE TABLE status (current_inning INTEGER,
+        STATS = '''CREATE TABLE IF NOT EXISTS status (current_inning INTEGER,
                                        current_inning_half INTEGER,
                                        current_inning_state TEXT,
                                        current_play_idx INTEGER,
                                        home_last_batter_id INTEGER,
                                        away_last_batter_id INTEGER,
                                        game_status TEXT,
-                                       last_update TEXT);'''
+                                       last_update TEXT,
+                                       game_pk INTEGER);'''
 
-        GAME = '''CREATE TABLE game (home_team_id TEXT,
+        GAME = '''CREATE TABLE IF NOT EXISTS game (home_team_id TEXT,
                                      home_team_abbrev TEXT,
                                      home_team_name TEXT,
                                      away_team_id TEXT,
@@ -48,31 +85,90 @@ class ScoreboardData:
                                      away_team_name TEXT,
                                      game_pk INTEGER);'''
 
-        PLAYERS = '''CREATE TABLE players (player_name TEXT,
+        PLAYERS = '''CREATE TABLE IF NOT EXISTS players (player_name TEXT,
                                            player_number INTEGER,
                                            player_id INTEGER,
                                            player_team_abbrev TEXT,
-                                           batting_order INTEGER);'''
+                                           batting_order INTEGER,
+                                           game_pk INTEGER);'''
 
-        TEAMS = '''CREATE TABLE teams (team_name TEXT,
+        TEAMS = '''CREATE TABLE IF NOT EXISTS teams (team_name TEXT,
                                        team_abbrev TEXT,
                                        team_short_name TEXT,
                                        team_id INTEGER);'''
 
+        INDEXES = ['CREATE UNIQUE INDEX IF NOT EXISTS status_game_pk ON status (game_pk)',
+                   'CREATE UNIQUE INDEX IF NOT EXISTS game_game_pk ON game (game_pk)',
+                   'CREATE INDEX IF NOT EXISTS players_game_pk ON players (game_pk)',
+                   'CREATE INDEX IF NOT EXISTS players_player_id ON players (player_id)',
+                   'CREATE INDEX IF NOT EXISTS players_team ON players (player_team_abbrev)',
+                   'CREATE INDEX IF NOT EXISTS teams_abbrev ON teams (team_abbrev)',
+                   'CREATE INDEX IF NOT EXISTS teams_id ON teams (team_id)']
+
         self.scoreboard_db.db_query(STATS)
         self.scoreboard_db.db_query(GAME)
         self.scoreboard_db.db_query(PLAYERS)
         self.scoreboard_db.db_query(TEAMS)
+        for index in INDEXES:
+            self.scoreboard_db.db_query(index)
 
     def load_all_mlb_teams(self):
-        team_data = self.api.fetch_teams_data()
+        teams = []
+
+        # a database kept from an earlier run already has the teams
+        if self.scoreboard_db.is_persistent():
+            results = self.scoreboard_db.db_query('SELECT team_name, team_abbrev, team_short_name, team_id '
+                                                  'FROM teams')
+            for row in results or []:
+                teams.append({'team_name': row[0],
+                              'team_abbrev': row[1],
+                              'team_short_name': row[2],
+                              'team_id': row[3]})
+
+        if len(teams) == 0:
+            try:
+                team_data = self.api.fetch_teams_data()
+            except mlb_api.MLBAPIError as err:
+                sys.exit('Could not load MLB teams.\n{}'.format(err))
+
+            # load all MLB teams into database
+            for team in team_data:
+                teams.append({'team_name': team['name'],
+                              'team_abbrev': team['abbreviation'],
+                              'team_short_name': team['teamName'],
+                              'team_id': team['id']})
+            self.scoreboard_db.db_insert_many(self.table_teams, teams)
+
+        self.team_index = self.build_team_index(teams)
+
+    @staticmethod
+    def team_key(team):
+        return str(team).strip().lower()
+
+    def build_team_index(self, teams):
+        """
+        Map every way a team can be named -- abbreviation, full name, short name
+        and id, case-insensitive -- to its (team_name, team_short_name,
+        team_abbrev, team_id) record.  A name shared by two teams maps to None.
+
+        :param teams: teams table rows as dicts
+        :return:
+        """
+        team_index = {}
+        for team in teams:
+            record = (team['team_name'], team['team_short_name'], team['team_abbrev'], team['team_id'])
+            for alias in [team['team_abbrev'], team['team_name'], team['team_short_name'], team['team_id']]:
+                key = self.team_key(alias)
+                if key in team_index and team_index[key] != record:
+                    team_index[key] = None
+                else:
+                    team_index[key] = record
+        return team_index
 
-        # load all MLB teams into database
-        for team in team_data:
-            self.scoreboard_db.db_insert(self.table_teams, {'team_name': team['name'],
-                                                            'team_abbrev': team['abbreviation'],
-                                                            'team_short_name': team['teamName'],
-                                                            'team_id': team['id']})
+    def return_team_record(self, team):
+        if self.team_index is None:
+            return None
+        return self.team_index.get(self.team_key(team))
 
     def refresh_live_data(self, game_pk):
         current_play = ''
@@ -83,8 +179,15 @@ class ScoreboardData:
         last_away_batter_id = ''
 
         try:
+            # plays logged by the last refresh can be compacted by this one
+            compact_before = 0
+            if self.play_log_game_pk == game_pk:
+                compact_before = self.play_cursor[0]
+
             # get new data from MLB
-            self.live_data = self.api.fetch_live_feed_data(game_pk)
+            self.new_events = []
+            self.live_data = self.fetch_live_feed(game_pk)
+            self.update_play_log(game_pk)
 
             # update stats data in database
             game_status = self.live_data['gameData']['status']['detailedState']
@@ -100,14 +203,31 @@ class ScoreboardData:
                 last_home_batter_id, last_away_batter_id = self.return_last_batter_ids()
 
             # update current game status
-            self.update_status_table({'current_inning': current_inning,
-                                      'current_inning_half': inning_half,
-                                      'current_inning_state': inning_state,
-                                      'current_play_idx': current_play,
-                                      'home_last_batter_id' : last_home_batter_id,
-                                      'away_last_batter_id': last_away_batter_id,
-                                      'game_status': game_status,
-                                      'last_update': datetime.datetime.now()})
+            status = {'current_inning': current_inning,
+                      'current_inning_half': inning_half,
+                      'current_inning_state': inning_state,
+                      'current_play_idx': current_play,
+                      'home_last_batter_id' : last_home_batter_id,
+                      'away_last_batter_id': last_away_batter_id,
+                      'game_status': game_status,
+                      'last_update': datetime.datetime.now(),
+                      'game_pk': game_pk}
+
+            # only a changed game gets a new snapshot version and events
+            changes = dict(status, **self.return_game_state())
+            events = []
+            if self.snapshot.differs(changes):
+                events = (self.new_events or []) + self.build_snapshot_events(changes)
+                self.snapshot = self.snapshot.replace(**changes)
+                if self.persist_status():
+                    self.update_status_table(status)
+            self.events = events
+            self.new_events = None
+            self.publish(events)
+
+            if config.SB_CONFIG.get('compact_live_data', True):
+                self.live_data = self.compact_live_data(compact_before)
+            self.player_index = self.build_player_index()
         except:
             print('A data error occurred.  Sometimes this is due to a race condition')
             print('between MLB data and the API.  Often restarting the scoreboard will')
@@ -115,11 +235,104 @@ class ScoreboardData:
 
         return self.live_data
 
-    def load_player_data(self):
+    def compact_live_data(self, compact_before):
+        """
+        Return the live feed trimmed to what the scoreboard and the play log
+        still need.  Other modes get a pruned copy, keeping the pitches of the
+        play still open, and the full feed is let go.
+        In incremental mode the full feed has to stay for the next patch, so
+        only the pitch by pitch of plays logged before this refresh is dropped
+        from it; the feed may be shared, and a viewer one refresh behind still
+        finds the events it hasn't seen.
+
+        :param compact_before: index of the first play not to compact
+        :return:
+        """
+        if config.SB_CONFIG.get('live_feed', 'full') == 'incremental':
+            if self.compacted_feed != id(self.live_data):
+                self.compacted_feed = id(self.live_data)
+                self.compacted_plays = 0
+
+            with _live_feed_lock:
+                all_plays = self.live_data['liveData']['plays']['allPlays']
+                for play_data in all_plays[self.compacted_plays:compact_before]:
+                    if len(play_data.get('playEvents', [])) > 0:
+                        play_data['playEvents'] = []
+            self.compacted_plays = max(self.compacted_plays, compact_before)
+            return self.live_data
+
+        compact_data = feed_stream.prune(self.live_data, _retained_tree)
+
+        # the play still open keeps its pitches; this copy is also the last good
+        # feed served while MLB is down, and the play log's cursor is into them
+        all_plays = self.live_data['liveData']['plays']['allPlays']
+        compact_plays = compact_data['liveData']['plays']['allPlays']
+        for play_idx in range(self.play_cursor[0], len(all_plays)):
+            if 'playEvents' in all_plays[play_idx]:
+                compact_plays[play_idx]['playEvents'] = all_plays[play_idx]['playEvents']
+
+        self.api.replace_last_good(self.live_data, compact_data)
+        return compact_data
+
+    @staticmethod
+    def live_feed_projection():
+        # patches are computed against the full feed, so only the 'projected'
+        # mode can ask for a trimmed feed
+        if config.SB_CONFIG.get('live_feed', 'full') == 'projected':
+            return 'scoreboard'
+        return None
+
+    def fetch_live_feed(self, game_pk):
+        """
+        Return the current live feed for game_pk.  In incremental mode only the
+        diffPatch changes since the last feed's timestamp are fetched and applied
+        to the cached feed in place; any break in the patch chain falls back to
+        fetching the full feed.
+
+        The cached feed may be shared with other viewers of the game, so patches
+        are requested from the feed's own timestamp and skipped if another viewer
+        has already moved the feed past it.
+
+        :param game_pk:
+        :return:
+        """
+        live_data = None
+
+        if config.SB_CONFIG.get('live_feed', 'full') == 'incremental' and self.live_data is not None and \
+                self.live_data_game_pk == game_pk:
+            try:
+                timecode = self.live_data['metaData']['timeStamp']
+                patch_data = self.api.fetch_live_feed_patch(game_pk, timecode)
+
+                # MLB sends the whole feed when the patch chain is too long
+                if isinstance(patch_data, dict):
+                    live_data = patch_data
+                else:
+                    with _live_feed_lock:
+                        if self.live_data['metaData']['timeStamp'] == timecode:
+                            for patch in patch_data:
+                                json_patch.apply_patch(self.live_data, patch['diff'])
+                    live_data = self.live_data
+            except (mlb_api.MLBAPIError, json_patch.JsonPatchError, KeyError, TypeError):
+                live_data = None
+
+        if live_data is None or 'metaData' not in live_data:
+            if config.SB_CONFIG.get('live_feed', 'full') == 'streamed':
+                live_data = self.api.fetch_live_feed_streamed(game_pk, 'scoreboard')
+            else:
+                live_data = self.api.fetch_live_feed_data(game_pk, self.live_feed_projection())
+
+        self.live_data_game_pk = game_pk
+        self.live_data_stale_since = self.api.stale_since(self.api.API_LIVEFEED_URL.format(game_pk))
+
+        return live_data
+
+    def load_player_data(self, game_pk):
         teams_data = self.return_boxscore_data()['teams']
 
         try:
             # load database with player data for this game
+            players = []
 
             # away players
             away_team = self.return_a_team_name(teams_data['away']['team']['id'])[2]
@@ -127,10 +340,11 @@ class ScoreboardData:
                 id = teams_data['away']['players'][str(player_id)]['person']['id']
                 player_name = teams_data['away']['players'][str(player_id)]['person']['fullName']
                 player_jersey_no = teams_data['away']['players'][str(player_id)]['jerseyNumber']
-                self.scoreboard_db.db_insert('players', {'player_name': player_name,
-                                                      'player_number': player_jersey_no,
-                                                      'player_id': id,
-                                                      'player_team_abbrev': away_team})
+                players.append({'player_name': player_name,
+                                'player_number': player_jersey_no,
+                                'player_id': id,
+                                'player_team_abbrev': away_team,
+                                'game_pk': game_pk})
 
             # home players
             home_team = self.return_a_team_name(teams_data['home']['team']['id'])[2]
@@ -138,68 +352,404 @@ class ScoreboardData:
                 id = teams_data['home']['players'][str(player_id)]['person']['id']
                 name = teams_data['home']['players'][str(player_id)]['person']['fullName']
                 jersey = teams_data['home']['players'][str(player_id)]['jerseyNumber']
-                self.scoreboard_db.db_insert('players', {'player_name': name,
-                                                         'player_number': jersey,
-                                                         'player_id': id,
-                                                         'player_team_abbrev': home_team})
+                players.append({'player_name': name,
+                                'player_number': jersey,
+                                'player_id': id,
+                                'player_team_abbrev': home_team,
+                                'game_pk': game_pk})
+
+            self.scoreboard_db.db_delete(self.table_players, 'game_pk={}'.format(int(game_pk)))
+            self.scoreboard_db.db_insert_many(self.table_players, players)
         except:
             print('A data error occurred.  Sometimes this is due to a race condition')
             print('between MLB data and the API.  Often restarting the scoreboard will')
             print('clear the error.')
 
     def return_last_batter_ids(self):
-        home_batter_id = 0
-        away_batter_id = 0
-
+        """
+        Return the ids of the last home and away batters to complete a plate
+        appearance, from the play log.
+
+        :return: (home batter id, away batter id)
+        """
+        if self.last_batter_ids is None:
+            return 0, 0
+        return self.last_batter_ids['home'], self.last_batter_ids['away']
+
+    def return_snapshot(self):
+        return self.snapshot
+
+    def return_game_state(self):
+        """
+        Return the score, count and number of events in the current play, the
+        parts of the snapshot that change pitch by pitch.
+
+        :return:
+        """
+        linescore = self.live_data['liveData']['linescore']
+        current_play = self.live_data['liveData']['plays'].get('currentPlay', {})
+        count = current_play.get('count', {})
+        return {'current_play_events': len(current_play.get('playEvents', [])),
+                'balls': count.get('balls', 0),
+                'strikes': count.get('strikes', 0),
+                'outs': count.get('outs', 0),
+                'away_score': linescore.get('teams', {}).get('away', {}).get('runs', 0),
+                'home_score': linescore.get('teams', {}).get('home', {}).get('runs', 0)}
+
+    def build_snapshot_events(self, changes):
+        """
+        Return the status, inning and score events between the current
+        snapshot and changes.  The first refresh of a game has none.
+
+        :param changes: the next snapshot's fields
+        :return:
+        """
+        events = []
+        game_pk = changes['game_pk']
+        if self.snapshot.game_pk != game_pk:
+            return events
+
+        if changes['game_status'] != self.snapshot.game_status:
+            events.append(game_events.StatusChange(game_pk,
+                                                   game_status=changes['game_status'],
+                                                   previous_game_status=self.snapshot.game_status))
+        if changes['current_inning'] != self.snapshot.current_inning or \
+                changes['current_inning_half'] != self.snapshot.current_inning_half or \
+                changes['current_inning_state'] != self.snapshot.current_inning_state:
+            events.append(game_events.InningChange(game_pk,
+                                                   inning=changes['current_inning'],
+                                                   inning_half=changes['current_inning_half'],
+                                                   inning_state=changes['current_inning_state']))
+        if changes['away_score'] != self.snapshot.away_score or changes['home_score'] != self.snapshot.home_score:
+            events.append(game_events.ScoreChange(game_pk,
+                                                  away_score=changes['away_score'],
+                                                  home_score=changes['home_score'],
+                                                  previous_away_score=self.snapshot.away_score,
+                                                  previous_home_score=self.snapshot.home_score))
+        return events
+
+    def subscribe(self, callback, event_types=None):
+        """
+        Call callback(event) for every event published by refresh_live_data,
+        or only those of the classes in event_types.
+
+        :param callback:
+        :param event_types: game_events classes, or None for all
+        :return:
+        """
+        if event_types is not None:
+            event_types = tuple(event_types)
+        self.subscribers.append((callback, event_types))
+
+    def unsubscribe(self, callback):
+        self.subscribers = [subscriber for subscriber in self.subscribers if subscriber[0] != callback]
+
+    def publish(self, events):
+        for event in events:
+            for callback, event_types in self.subscribers:
+                if event_types is not None and not isinstance(event, event_types):
+                    continue
+                try:
+                    callback(event)
+                except Exception as err:
+                    print('Event subscriber error: {}'.format(err))
+
+    def return_events(self):
+        return self.events
+
+    def queue_event(self, event):
+        # events are only kept while refresh_live_data is collecting them
+        if self.new_events is not None:
+            self.new_events.append(event)
+
+    def build_player_index(self):
+        """
+        Map each player id in the boxscore to ('away' or 'home', boxscore
+        player record), so stat lookups don't scan both rosters.
+
+        :return:
+        """
+        player_index = {}
+        teams_data = self.live_data['liveData']['boxscore']['teams']
+        for side in ['away', 'home']:
+            for player in teams_data[side]['players'].values():
+                player_index[player['person']['id']] = (side, player)
+        return player_index
+
+    def return_player(self, player_id):
+        """
+        Return ('away' or 'home', boxscore player record) for player_id, or
+        None if the player isn't in this game.
+
+        :param player_id:
+        :return:
+        """
+        if self.player_index is None:
+            return None
         try:
-            last_batter_inning = self.return_current_inning() - 1  # 0-based list
-            plays_data = self.live_data['liveData']['plays']
-
-            if self.return_current_inning() > 1:
-
-                if len(plays_data['playsByInning'][int(last_batter_inning)]['top']) > 0:
-                    last_away_batter_play_idx = plays_data['playsByInning'][int(last_batter_inning)]['top'][-1]
-                else:
-                    # drop back to last inning
-                    last_away_batter_play_idx = plays_data['playsByInning'][int(last_batter_inning) - 1]['top'][-1]
-                away_batter_id = plays_data['allPlays'][last_away_batter_play_idx]['matchup']['batter']['id']
-
-                if len(plays_data['playsByInning'][int(last_batter_inning)]['bottom']) > 0:
-                    last_home_batter_play_idx = plays_data['playsByInning'][int(last_batter_inning)]['bottom'][-1]
-                else:
-                    # drop back to last inning
-                    last_home_batter_play_idx = plays_data['playsByInning'][int(last_batter_inning) - 1]['bottom'][-1]
-                home_batter_id = plays_data['allPlays'][last_home_batter_play_idx]['matchup']['batter']['id']
-        except:
-            print('A data error occurred.  Sometimes this is due to a race condition')
-            print('between MLB data and the API.  Often restarting the scoreboard will')
-            print('clear the error.')
+            return self.player_index.get(int(player_id))
+        except (TypeError, ValueError):
+            return None
+
+    def reset_play_log(self, game_pk):
+        """
+        Start the play log over for game_pk.  Batting orders are seeded from
+        the boxscore, and every player who has appeared in the lineup is given
+        his batting order slot (0-8).
+
+        :param game_pk:
+        :return:
+        """
+        self.play_log = {}
+        self.play_log_game_pk = game_pk
+        self.play_cursor = (0, 0)
+        self.last_batter_ids = {'away': 0, 'home': 0}
+        self.pitch_counts = {}
+        self.scoring_plays = []
+        self.last_logged_play = None
+        self.batting_orders = {}
+        self.lineup_slots = {}
+
+        teams_data = self.live_data['liveData']['boxscore']['teams']
+        for side in ['away', 'home']:
+            batting_order = list(teams_data[side]['battingOrder'])
+            lineup_slots = {}
+            for player in teams_data[side]['players'].values():
+                if 'battingOrder' in player:
+                    lineup_slots[player['person']['id']] = int(player['battingOrder']) // 100 - 1
+            for slot, player_id in enumerate(batting_order):
+                lineup_slots[player_id] = slot
+            self.batting_orders[side] = batting_order
+            self.lineup_slots[side] = lineup_slots
+
+    def update_play_log(self, game_pk):
+        """
+        Ingest the plays and play events not seen on an earlier refresh.  The
+        cursor is (first play not yet logged, events of it already seen), so
+        the current play is picked up where it left off and each refresh only
+        costs the new pitches and at-bats.
+
+        :param game_pk:
+        :return:
+        """
+        all_plays = self.live_data['liveData']['plays']['allPlays']
+
+        if self.play_log_game_pk != game_pk or self.play_cursor[0] > len(all_plays):
+            self.reset_play_log(game_pk)
+
+            # catching up on the game so far isn't news
+            self.new_events = None
+
+        play_idx, event_idx = self.play_cursor
+        while play_idx < len(all_plays):
+            play_data = all_plays[play_idx]
+            play_events = play_data.get('playEvents', [])
+            for event_data in play_events[event_idx:]:
+                self.process_play_event(play_data, event_data)
+
+            # never back up: a feed with fewer events would replay them later
+            event_idx = max(event_idx, len(play_events))
+
+            # the last play stays open until it is complete
+            if play_idx == len(all_plays) - 1 and not play_data['about'].get('isComplete', False):
+                break
+            self.log_play(play_data)
+            play_idx += 1
+            event_idx = 0
+
+        self.play_cursor = (play_idx, event_idx)
+
+    def log_live_data(self, game_pk, live_data):
+        """
+        Bring the play log up to date with a live feed fetched elsewhere,
+        without the status, snapshot and events of refresh_live_data.
+
+        :param game_pk:
+        :param live_data: the full live feed
+        :return:
+        """
+        self.live_data = live_data
+        self.live_data_game_pk = game_pk
+        self.update_play_log(game_pk)
+
+    def process_play_event(self, play_data, event_data):
+        if event_data.get('isPitch', False):
+            pitcher_id = play_data['matchup']['pitcher']['id']
+            details = event_data.get('details', {})
+            self.pitch_counts[pitcher_id] = self.pitch_counts.get(pitcher_id, 0) + 1
+            self.queue_event(game_events.NewPitch(self.play_log_game_pk,
+                                                  at_bat_index=play_data['atBatIndex'],
+                                                  pitcher_id=pitcher_id,
+                                                  batter_id=play_data['matchup']['batter']['id'],
+                                                  pitch_number=event_data.get('pitchNumber'),
+                                                  description=details.get('description', ''),
+                                                  pitch_type=details.get('type', {}).get('description', ''),
+                                                  pitch_count=self.pitch_counts[pitcher_id]))
+        self.process_substitution(event_data)
+
+    def log_play(self, play_data):
+        """
+        Add a completed play to the log and update the last batter and scoring
+        plays.
+
+        :param play_data: an allPlays entry
+        :return:
+        """
+        about = play_data['about']
+        side = 'away' if about['halfInning'] == 'top' else 'home'
+        logged_play = {'at_bat_index': play_data['atBatIndex'],
+                       'inning': about['inning'],
+                       'inning_half': about['halfInning'],
+                       'batter_id': play_data['matchup']['batter']['id'],
+                       'pitcher_id': play_data['matchup']['pitcher']['id'],
+                       'event': play_data['result'].get('event', ''),
+                       'description': play_data['result'].get('description', ''),
+                       'is_scoring_play': about.get('isScoringPlay', False),
+                       'side': side}
+
+        self.play_log[logged_play['at_bat_index']] = logged_play
+        self.last_logged_play = logged_play
+        self.last_batter_ids[side] = logged_play['batter_id']
+        if logged_play['is_scoring_play']:
+            self.scoring_plays.append(logged_play['at_bat_index'])
+
+        self.queue_event(game_events.NewPlay(self.play_log_game_pk,
+                                             at_bat_index=logged_play['at_bat_index'],
+                                             inning=logged_play['inning'],
+                                             inning_half=logged_play['inning_half'],
+                                             batter_id=logged_play['batter_id'],
+                                             pitcher_id=logged_play['pitcher_id'],
+                                             event=logged_play['event'],
+                                             description=logged_play['description'],
+                                             is_scoring_play=logged_play['is_scoring_play']))
+
+    def return_last_logged_play(self):
+        return self.last_logged_play
+
+    def return_logged_play(self, at_bat_index):
+        if self.play_log is None:
+            return None
+        return self.play_log.get(at_bat_index)
+
+    def return_scoring_plays(self):
+        if self.play_log is None:
+            return []
+        return [self.play_log[at_bat_index] for at_bat_index in self.scoring_plays]
 
-        return home_batter_id, away_batter_id
+    def return_pitch_count(self, pitcher_id):
+        if self.pitch_counts is None:
+            return 0
+        return self.pitch_counts.get(pitcher_id, 0)
+
+    def process_substitution(self, event_data):
+        """
+        Put the player coming in into the batting order slot of the player
+        he replaced.  The feed has used both 'replacedPlayer' and
+        'playerReplaced' for the player leaving.
+
+        :param event_data: a playEvents entry
+        :return:
+        """
+        if 'player' not in event_data:
+            return
+        replaced = event_data.get('replacedPlayer', event_data.get('playerReplaced'))
+        if replaced is None:
+            return
+
+        player_id = event_data['player']['id']
+        replaced_id = replaced['id']
+        sub_side = None
+        slot = None
+        for side in ['away', 'home']:
+            lineup_slots = self.lineup_slots[side]
+            if replaced_id in lineup_slots:
+                sub_side = side
+                slot = lineup_slots[replaced_id]
+                lineup_slots[player_id] = slot
+                batting_order = self.batting_orders[side]
+                if 0 <= slot < len(batting_order):
+                    batting_order[slot] = player_id
+                break
+            if player_id in lineup_slots:
+                # the replaced player left before the tracker started
+                lineup_slots[replaced_id] = lineup_slots[player_id]
+                break
+
+        # pitchers not hitting have no slot
+        if sub_side is None:
+            player = self.return_player(replaced_id)
+            if player is not None:
+                sub_side = player[0]
+        self.queue_event(game_events.Substitution(self.play_log_game_pk,
+                                                  side=sub_side,
+                                                  player_id=player_id,
+                                                  replaced_id=replaced_id,
+                                                  slot=slot))
+
+    def return_batting_order(self, side):
+        if self.batting_orders is None:
+            return []
+        return self.batting_orders.get(side, [])
+
+    def return_due_up_ids(self, side, last_batter_id, count=3):
+        """
+        Return the ids of the next count batters after last_batter_id, whose
+        slot is taken even if he has since been substituted for.
+
+        :param side: 'away' or 'home'
+        :param last_batter_id:
+        :param count:
+        :return:
+        """
+        batting_order = self.return_batting_order(side)
+        slot = self.lineup_slots[side][last_batter_id]
+        return [batting_order[(slot + i) % len(batting_order)] for i in range(1, count + 1)]
+
+    def return_batter_stats(self, batter_id):
+        """
+        :param batter_id:
+        :return: [name, hits, at bats, season avg]
+        """
+        stats = ['', '', '', '']
+        player = self.return_player(batter_id)
+        if player is not None:
+            record = player[1]
+            try:
+                stats = [record['person']['fullName'],
+                         record['stats']['batting']['hits'],
+                         record['stats']['batting']['atBats'],
+                         record['seasonStats']['batting']['avg']]
+            except KeyError:
+                stats = ['', '', '', '']
+        return stats
+
+    def return_pitcher_stats(self, pitcher_id):
+        """
+        :param pitcher_id:
+        :return: [wins, losses, era]
+        """
+        stats = ['0', '0', '-.--']
+        player = self.return_player(pitcher_id)
+        if player is not None:
+            record = player[1]
+            try:
+                stats = [record['seasonStats']['pitching']['wins'],
+                         record['seasonStats']['pitching']['losses'],
+                         record['seasonStats']['pitching']['era']]
+            except KeyError:
+                stats = ['0', '0', '-.--']
+        return stats
 
     def return_home_team(self):
-        sql = 'SELECT t.team_name, g.home_team_name from game g, teams t WHERE g.home_team_id = t.team_id'
-        results = self.scoreboard_db.db_query(sql)
-        if results is not None and len(results) > 0:
-            return results[0][0]
-        else:
-            return 'UNK'
+        return self.snapshot.home_team_name
 
     def return_away_team(self):
-        sql = 'SELECT t.team_name, g.away_team_name from game g, teams t WHERE g.away_team_id = t.team_id'
-        results = self.scoreboard_db.db_query(sql)
-        if results is not None and len(results) > 0:
-            return results[0][0]
-        else:
-            return 'UNK'
+        return self.snapshot.away_team_name
 
     def return_team_id(self, team):
-        sql = 'SELECT team_id FROM teams WHERE team_abbrev=\'{}\' or team_name=\'{}\' or ' \
-              'team_short_name=\'{}\' or team_id=\'{}\''.format(team, team, team, team)
-
-        results = self.scoreboard_db.db_query(sql)
-        if results is not None and len(results[0]) > 0:
-            return results[0][0]
+        record = self.return_team_record(team)
+        if record is not None:
+            return record[3]
         else:
             return ''
 
@@ -212,33 +762,100 @@ class ScoreboardData:
             return []
 
     def return_a_team_name(self, key):
-        sql = 'SELECT team_name, team_short_name, team_abbrev FROM teams WHERE ' \
-              'team_name = \'{}\' OR team_short_name = \'{}\' OR team_abbrev = \'{}\' OR team_id = {}' \
-              .format(key, key, key, key)
-        results = self.scoreboard_db.db_query(sql)
-        if results is not None and len(results[0]) > 0:
-            return results[0]
+        record = self.return_team_record(key)
+        if record is not None:
+            return record[:3]
         else:
             return []
 
     def validate_team_name(self, team):
-        sql = 'SELECT COUNT(team_abbrev) FROM teams WHERE team_abbrev=\'{}\' or team_name=\'{}\' or ' \
-              'team_short_name=\'{}\' or team_id=\'{}\''.format(team, team, team, team)
-        results = self.scoreboard_db.db_query(sql)
-        if results is not None and len(results[0]) > 0:
-            if results[0][0] == 1:
-                return True
-        else:
-            return False
+        return self.return_team_record(team) is not None
+
+    def persist_status(self):
+        return config.SB_CONFIG.get('persist_status', False) or self.scoreboard_db.is_persistent()
 
     def update_game_table(self, items):
-        self.scoreboard_db.db_delete('game')
+        self.scoreboard_db.db_delete('game', 'game_pk={}'.format(int(items['game_pk'])))
         self.scoreboard_db.db_insert('game', items)
 
     def update_status_table(self, items):
-        self.scoreboard_db.db_delete('status')
+        self.scoreboard_db.db_delete('status', 'game_pk={}'.format(int(items['game_pk'])))
         self.scoreboard_db.db_insert('status', items)
 
+    def refresh_slate(self, game_date):
+        """
+        Refresh every game of game_date from one hydrated schedule request,
+        instead of one live feed request per game.  Each game is kept in the
+        shape of the live feed's 'tile' projection, plus probable pitchers, so
+        it can be drawn the same way.
+
+        :param game_date: MM/DD/YYYY
+        :return: dict of game_pk to game
+        """
+        slate = {}
+        slate_data = self.api.fetch_slate_data(game_date)
+        for date_data in slate_data.get('dates', []):
+            for game in date_data['games']:
+                slate[game['gamePk']] = self.build_slate_game(game)
+        self.slate = slate
+        return slate
+
+    @staticmethod
+    def build_slate_game(game):
+        """
+        :param game: a game from the hydrated schedule
+        :return: the game in the shape of the live feed's 'tile' projection
+        """
+        # the schedule has the start in UTC, the feed has it in local time
+        game_time = {}
+        try:
+            start = datetime.datetime.strptime(game['gameDate'], '%Y-%m-%dT%H:%M:%SZ')
+            start = start.replace(tzinfo=datetime.timezone.utc).astimezone()
+            game_time = {'time': start.strftime('%I:%M').lstrip('0'), 'ampm': start.strftime('%p')}
+        except (KeyError, ValueError):
+            pass
+
+        teams = {}
+        probable_pitchers = {}
+        for side in ['away', 'home']:
+            team = game['teams'][side]['team']
+            teams[side] = {'id': team['id'],
+                           'abbreviation': team.get('abbreviation', team.get('name', ''))}
+            if 'probablePitcher' in game['teams'][side]:
+                pitcher = game['teams'][side]['probablePitcher']
+                probable_pitchers[side] = {'id': pitcher['id'], 'fullName': pitcher.get('fullName', '')}
+
+        return {'gameData': {'status': {'detailedState': game['status']['detailedState']},
+                             'datetime': game_time,
+                             'teams': teams,
+                             'probablePitchers': probable_pitchers},
+                'liveData': {'linescore': game.get('linescore', {})}}
+
+    def return_slate(self):
+        return self.slate
+
+    def return_game_history(self, team=''):
+        """
+        Return (game_pk, away_team_abbrev, home_team_abbrev, game_status,
+        last_update) for every game kept in the database, newest first,
+        optionally only games played by team.
+
+        :param team:
+        :return:
+        """
+        sql = 'SELECT g.game_pk, g.away_team_abbrev, g.home_team_abbrev, s.game_status, s.last_update ' \
+              'FROM game g LEFT JOIN status s ON s.game_pk = g.game_pk'
+        record = self.return_team_record(team) if team != '' else None
+        if record is not None:
+            sql += ' WHERE g.home_team_abbrev = \'{}\' OR g.away_team_abbrev = \'{}\''.format(record[2], record[2])
+        sql += ' ORDER BY s.last_update DESC'
+
+        results = self.scoreboard_db.db_query(sql)
+        if results is not None:
+            return results
+        else:
+            return []
+
     # def set_batting_order(self):
     #     boxscore = self.get_boxscore_data()
     #     home_batting_order = boxscore['teams']['home']['battingOrder']
@@ -271,20 +888,19 @@ class ScoreboardData:
         return inning_data[2]
 
     def return_current_play_index(self):
-        sql = 'SELECT current_play_idx FROM status'
-        results = self.scoreboard_db.db_query(sql)
-        if results is not None and len(results[0]) > 0:
-            return results[0][0]
-        else:
-            return 0
+        return self.snapshot.current_play_idx
+
+    def return_stale_since(self):
+        """
+        Return when MLB stopped answering if the live data being shown is the
+        last good feed, otherwise None.
+
+        :return:
+        """
+        return self.live_data_stale_since
 
     def return_game_status(self):
-        sql = 'SELECT game_status FROM status'
-        results = self.scoreboard_db.db_query(sql)
-        if results is not None and len(results[0]) > 0:
-            return results[0][0]
-        else:
-            return 'UNK'
+        return self.snapshot.game_status
 
     def return_last_play_data(self):
         try:
@@ -338,21 +954,24 @@ class ScoreboardData:
             # load data for this game into database
 
             # load player data
-            self.load_player_data()
+            self.load_player_data(game_pk)
 
             # get home and away team ids
             teams_data = self.return_boxscore_data()['teams']
             home_team_id = teams_data['home']['team']['id']
             away_team_id = teams_data['away']['team']['id']
 
-            # write game data to database
-            self.update_game_table({'home_team_id': home_team_id,
-                                    'away_team_id': away_team_id,
-                                    'home_team_abbrev': self.return_a_team_name(home_team_id)[2],
-                                    'away_team_abbrev': self.return_a_team_name(away_team_id)[2],
-                                    'home_team_name': self.return_a_team_name(home_team_id)[0],
-                                    'away_team_name': self.return_a_team_name(away_team_id)[0],
-                                    'game_pk': game_pk})
+            # keep game data in the snapshot, and the database if asked to
+            game = {'home_team_id': home_team_id,
+                    'away_team_id': away_team_id,
+                    'home_team_abbrev': self.return_a_team_name(home_team_id)[2],
+                    'away_team_abbrev': self.return_a_team_name(away_team_id)[2],
+                    'home_team_name': self.return_a_team_name(home_team_id)[0],
+                    'away_team_name': self.return_a_team_name(away_team_id)[0],
+                    'game_pk': game_pk}
+            self.snapshot = self.snapshot.replace(**game)
+            if self.persist_status():
+                self.update_game_table(game)
         except:
             print('A data error occurred.  Sometimes this is due to a race condition')
             print('between MLB data and the API.  Often restarting the scoreboard will')
@@ -0,0 +1,231 @@
+import datetime
+import html
+import json
+import os
+import sys
+
+import terminal_renderer
+
+"""
+The scoreboard as data, and the printers that show it.
+
+MLBLiveScoreboard.build_frame turns the current game snapshot into a Frame:
+the game title, the inning headers and two line-score rows, the status block,
+the note and the banner.  A frame is immutable and built once per snapshot
+version, so printing the same game state again costs nothing but the print.
+
+Printers take a frame and show it: TerminalPrinter draws the familiar text
+scoreboard through a TerminalRenderer, JSONPrinter writes one JSON object per
+frame, and HTMLPrinter writes a self-refreshing HTML page.
+"""
+
+
+def scoreboard_width(inning_headers):
+    """
+    Width of the text scoreboard for these inning headers, which the status
+    block and note are wrapped to.
+
+    :param inning_headers:
+    :return:
+    """
+    return (len(inning_headers) * 5 + len(inning_headers[0])) - 3
+
+
+class Frame:
+    """
+    Immutable picture of the scoreboard for one snapshot version.
+    """
+
+    __slots__ = ('version',
+                 'game_pk',
+                 'game_status',
+                 'updated',
+                 'stale_since',
+                 'title',
+                 'inning_headers',
+                 'away_line',
+                 'home_line',
+                 'status',
+                 'note',
+                 'banner')
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            value = fields.get(name)
+            if isinstance(value, list):
+                value = tuple(value)
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Frame is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Frame is immutable')
+
+    def as_dict(self):
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        for name in ['inning_headers', 'away_line', 'home_line']:
+            fields[name] = list(fields[name])
+        return fields
+
+
+class TerminalPrinter:
+    renderer = None
+
+    def __init__(self, renderer=None):
+        self.renderer = renderer if renderer is not None else terminal_renderer.TerminalRenderer()
+
+    def reset(self):
+        self.renderer.reset()
+
+    @staticmethod
+    def format_line_score(inning_headers, line_score):
+        cells = []
+        for i, x in enumerate(line_score):
+            # totals are set off with a bar
+            if inning_headers[i] == 'R':
+                cells[-1] = cells[-1][:-1] + '|'
+            cells.append(' {:<3} '.format(x))
+        return ''.join(cells)
+
+    def format_frame(self, frame):
+        """
+        Return the text scoreboard as a list of lines.
+
+        :param frame:
+        :return:
+        """
+        double_bar = '=' * scoreboard_width(frame.inning_headers)
+        single_bar = '-' * len(double_bar)
+
+        lines = ['Retrieved game data from MLB ({})...\n'.format(frame.updated)]
+
+        # MLB not answering, say how old the data on screen is
+        if frame.stale_since is not None:
+            lines.append('MLB data unavailable since {}, showing last good data...\n'.format(
+                datetime.datetime.fromtimestamp(frame.stale_since).strftime('%X')))
+
+        lines.append(frame.title)
+        lines.append(double_bar)
+        lines.append(''.join(' {:<3}|'.format(x) for x in frame.inning_headers))
+        lines.append(single_bar)
+        lines.append(self.format_line_score(frame.inning_headers, frame.away_line))
+        lines.append(self.format_line_score(frame.inning_headers, frame.home_line))
+        lines.append(single_bar)
+
+        if frame.status:
+            lines.append(frame.status)
+
+        # wrap the note to the scoreboard
+        if frame.note:
+            if len(frame.note) > len(double_bar):
+                lines.append('Note: ' + frame.note[:len(double_bar) - 5])
+                lines.append('      ' + frame.note[len(double_bar) - 5 + 1:])
+            else:
+                lines.append('Note: ' + frame.note)
+
+        lines.append(double_bar)
+        lines.append(frame.banner)
+        return lines
+
+    def print_frame(self, frame):
+        self.renderer.render(self.format_frame(frame))
+
+
+class JSONPrinter:
+    stream = None
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+
+    def reset(self):
+        pass
+
+    @staticmethod
+    def format_frame(frame):
+        return json.dumps(frame.as_dict(), default=str)
+
+    def print_frame(self, frame):
+        # one frame per line
+        self.stream.write(self.format_frame(frame) + '\n')
+        self.stream.flush()
+
+
+class HTMLPrinter:
+    html_file = None
+    refresh = None
+
+    PAGE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta http-equiv="refresh" content="{refresh}">
+<title>{title}</title>
+<style>
+body {{ font-family: monospace; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 2px 8px; text-align: left; }}
+tr.bar {{ border-bottom: 1px solid; }}
+td.total, th.total {{ border-left: 1px solid; }}
+</style>
+</head>
+<body>
+<p>{updated}</p>
+<h3>{title}</h3>
+<table>
+{rows}
+</table>
+<pre>{status}</pre>
+<p>{banner}</p>
+</body>
+</html>
+'''
+
+    def __init__(self, html_file=None, refresh=20):
+        self.html_file = html_file
+        self.refresh = refresh
+
+    def reset(self):
+        pass
+
+    @staticmethod
+    def format_row(tag, inning_headers, cells):
+        row = []
+        for i, cell in enumerate(cells):
+            css_class = ' class="total"' if inning_headers[i] == 'R' else ''
+            row.append('<{}{}>{}</{}>'.format(tag, css_class, html.escape(str(cell)), tag))
+        return ''.join(row)
+
+    def format_frame(self, frame):
+        rows = ['<tr class="bar">{}</tr>'.format(self.format_row('th', frame.inning_headers, frame.inning_headers)),
+                '<tr>{}</tr>'.format(self.format_row('td', frame.inning_headers, frame.away_line)),
+                '<tr>{}</tr>'.format(self.format_row('td', frame.inning_headers, frame.home_line))]
+
+        updated = 'Retrieved game data from MLB ({})'.format(frame.updated)
+        if frame.stale_since is not None:
+            updated += ', MLB data unavailable since {}'.format(
+                datetime.datetime.fromtimestamp(frame.stale_since).strftime('%X'))
+
+        status = frame.status or ''
+        if frame.note:
+            status += '\nNote: ' + frame.note
+
+        return self.PAGE.format(refresh=self.refresh,
+                                title=html.escape(frame.title),
+                                updated=html.escape(updated),
+                                rows='\n'.join(rows),
+                                status=html.escape(status.strip('\n')),
+                                banner=html.escape(frame.banner))
+
+    def print_frame(self, frame):
+        page = self.format_frame(frame)
+        if self.html_file is None:
+            sys.stdout.write(page)
+            sys.stdout.flush()
+            return
+
+        # write a temp file first so a browser never loads half a page
+        temp_file = self.html_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(page)
+        os.replace(temp_file, self.html_file)
@@ -0,0 +1,297 @@
+import asyncio
+import datetime
+
+import config
+import mlb_api
+import mlb_api_async
+import scoreboard_data
+import terminal_renderer
+
+"""
+Compact line scores for every game of a day on one screen.
+
+With SB_CONFIG['grid_poll'] = 'slate' one hydrated schedule request per
+cycle (ScoreboardData.refresh_slate) refreshes every game, and only the focus
+games poll their own live feed.  With 'feeds' every game polls its live feed.
+Each live feed is polled by its own asyncio task, so a slow or failing game
+only holds up its own tile.  Focus games get the full feed, keep a play log
+of their own and show the count, runners, matchup and last play under their
+line score; the others get the small 'tile' projection.  Fetches go through MLB_API_Async and share its
+bounded worker pool.  The grid is redrawn through TerminalRenderer whenever a
+tile changes.
+"""
+
+GAME_STATUS_ENDED = ['GAME OVER', 'FINAL', 'POSTPONED', 'SUSPENDED', 'CANCELLED']
+GAME_STATUS_RUNNING = ['IN PROGRESS', 'DELAYED']
+GAME_STATUS_NOT_STARTED = ['SCHEDULED', 'WARMUP', 'PRE-GAME']
+
+# innings shown per tile; extra innings show the last ones
+TILE_INNINGS = 9
+
+# line of a tile holding the game status, after the header and line scores
+TILE_STATUS_LINE = 3
+
+
+def build_tile(live_data):
+    """
+    Return the lines of a game's tile: inning header, away and home line
+    scores and a status line.
+
+    :param live_data: the 'tile' projection of the live feed
+    :return:
+    """
+    game_data = live_data['gameData']
+    linescore = live_data['liveData'].get('linescore', {})
+    game_status = game_data['status']['detailedState']
+
+    innings = linescore.get('innings', [])[-TILE_INNINGS:]
+    first_inning = innings[0]['num'] if len(innings) > 0 else 1
+    inning_nums = [first_inning + i for i in range(TILE_INNINGS)]
+
+    lines = ['    ' + ''.join('{:>3}'.format(num) for num in inning_nums) + ' |  R  H  E']
+    for side in ['away', 'home']:
+        runs = [inning.get(side, {}).get('runs', '') for inning in innings]
+        runs += [''] * (TILE_INNINGS - len(runs))
+        totals = linescore.get('teams', {}).get(side, {})
+        lines.append('{:<4}'.format(game_data['teams'][side]['abbreviation']) +
+                     ''.join('{:>3}'.format(run) for run in runs) +
+                     ' |{:>3}{:>3}{:>3}'.format(totals.get('runs', ''), totals.get('hits', ''),
+                                                totals.get('errors', '')))
+
+    if game_status.upper() in GAME_STATUS_NOT_STARTED:
+        status_line = '{} {}{}'.format(game_status, game_data['datetime'].get('time', ''),
+                                       game_data['datetime'].get('ampm', ''))
+
+        # probable pitchers come with the slate
+        probable_pitchers = game_data.get('probablePitchers', {})
+        if 'away' in probable_pitchers and 'home' in probable_pitchers:
+            status_line += ', {} vs. {}'.format(probable_pitchers['away']['fullName'].split(' ')[-1],
+                                                probable_pitchers['home']['fullName'].split(' ')[-1])
+    elif game_status.upper() in GAME_STATUS_RUNNING and 'currentInningOrdinal' in linescore:
+        outs = linescore.get('outs', 0)
+        status_line = '{} {}, {} out{}'.format(linescore.get('inningState', ''), linescore['currentInningOrdinal'],
+                                               outs, '' if outs == 1 else 's')
+    else:
+        status_line = game_status
+    lines.append(status_line)
+
+    return lines
+
+
+def build_focus_lines(live_data, play_log, width):
+    """
+    Return the extra lines of a focus game's tile, cut to width: the count,
+    runners, matchup and last play while the game is running, the winning
+    and losing pitchers once it is over.
+
+    :param live_data: the full live feed
+    :param play_log: the game's ScoreboardData, its play log current with live_data
+    :param width:
+    :return:
+    """
+    game_status = live_data['gameData']['status']['detailedState'].upper()
+    linescore = live_data['liveData'].get('linescore', {})
+    current_play = live_data['liveData'].get('plays', {}).get('currentPlay')
+    lines = []
+
+    if game_status in GAME_STATUS_RUNNING and current_play is not None:
+        count = current_play.get('count', {})
+        offense = linescore.get('offense', {})
+        bases = [name for base, name in [('first', '1st'), ('second', '2nd'), ('third', '3rd')] if base in offense]
+        lines.append('Count {}-{}, {}'.format(count.get('balls', 0), count.get('strikes', 0),
+                                              'on ' + ' '.join(bases) if len(bases) > 0 else 'bases empty'))
+
+        # no matchup yet before the first pitch of a play
+        batter = current_play.get('matchup', {}).get('batter', {})
+        pitcher = current_play.get('matchup', {}).get('pitcher', {})
+        if 'fullName' in batter and 'fullName' in pitcher:
+            lines.append('{} vs. {} ({} pitches)'.format(batter['fullName'].split(' ')[-1],
+                                                         pitcher['fullName'].split(' ')[-1],
+                                                         play_log.return_pitch_count(pitcher.get('id'))))
+
+        last_play = play_log.return_last_logged_play()
+        if last_play is not None and len(last_play['description']) > 0:
+            lines.append('Last: ' + last_play['description'])
+    elif game_status in GAME_STATUS_ENDED or game_status[:9] in GAME_STATUS_ENDED:
+        decisions = live_data['liveData'].get('decisions', {})
+        if 'winner' in decisions and 'loser' in decisions:
+            lines.append('W: {}  L: {}'.format(decisions['winner']['fullName'].split(' ')[-1],
+                                               decisions['loser']['fullName'].split(' ')[-1]))
+
+    return [line[:width] for line in lines]
+
+
+class ScoreboardGrid:
+    api = None
+    api_async = None
+    scoreboard_data = None
+    renderer = None
+    columns = 2
+    refresh_rate = 30
+    delay_refresh_rate = 60
+    banner = ''
+    game_date = ''
+    game_pks = None
+    focus = None
+    focus_data = None
+    tiles = None
+    tile_status = None
+    version = 0
+
+    def __init__(self, api=None, columns=2, banner='', sb_data=None, focus=None):
+        self.api = api if api is not None else mlb_api.MLB_API()
+        self.api_async = mlb_api_async.MLB_API_Async(self.api)
+        self.scoreboard_data = sb_data if sb_data is not None else scoreboard_data.ScoreboardData(self.api)
+        self.focus = list(focus) if focus is not None else []
+        # focus games keep a play log of their own
+        self.focus_data = {game_pk: scoreboard_data.ScoreboardData(self.api) for game_pk in self.focus}
+        self.renderer = terminal_renderer.TerminalRenderer()
+        self.columns = max(1, int(columns))
+        self.refresh_rate = int(config.SB_CONFIG['refresh'])
+        self.delay_refresh_rate = int(config.SB_CONFIG['delay'])
+        self.banner = banner
+        self.game_pks = []
+        self.tiles = {}
+        self.tile_status = {}
+
+    def load_games(self, game_date):
+        """
+        Load the day's games, and their first tiles, from the slate.
+
+        :param game_date: MM/DD/YYYY
+        :return: number of games
+        """
+        self.game_date = game_date
+        slate = self.scoreboard_data.refresh_slate(game_date)
+        for game_pk, game in slate.items():
+            self.game_pks.append(game_pk)
+            self.tiles[game_pk] = build_tile(game)
+            self.tile_status[game_pk] = game['gameData']['status']['detailedState']
+        return len(self.game_pks)
+
+    async def refresh_tile(self, game_pk):
+        """
+        Keep one game's tile current until the game ends.  Focus games are
+        followed from their full live feed.
+
+        :param game_pk:
+        :return:
+        """
+        focus = game_pk in self.focus
+        while True:
+            try:
+                live_data = await self.api_async.fetch_live_feed_data(game_pk, None if focus else 'tile')
+                tile = build_tile(live_data)
+                self.tile_status[game_pk] = live_data['gameData']['status']['detailedState']
+                if self.api.stale_since(self.api.API_LIVEFEED_URL.format(game_pk)) is not None:
+                    tile[TILE_STATUS_LINE] += ' (stale)'
+                if focus:
+                    self.focus_data[game_pk].log_live_data(game_pk, live_data)
+                    tile += build_focus_lines(live_data, self.focus_data[game_pk], len(tile[0]))
+            except (mlb_api.MLBAPIError, KeyError, TypeError):
+                # keep the last tile, marked, and try again next time
+                tile = list(self.tiles[game_pk])
+                if not tile[TILE_STATUS_LINE].endswith(' (no data)'):
+                    tile[TILE_STATUS_LINE] += ' (no data)'
+
+            self.update_tile(game_pk, tile)
+
+            game_status = self.tile_status[game_pk].upper()
+            if game_status in GAME_STATUS_ENDED or game_status[:9] in GAME_STATUS_ENDED:
+                return
+            if game_status in GAME_STATUS_RUNNING:
+                await asyncio.sleep(self.refresh_rate)
+            else:
+                await asyncio.sleep(self.delay_refresh_rate)
+
+    def update_tile(self, game_pk, tile):
+        if tile != self.tiles[game_pk]:
+            self.tiles[game_pk] = tile
+            self.version += 1
+
+    async def refresh_slate_tiles(self):
+        """
+        Keep the tiles of every game not in focus current from one schedule
+        request per cycle, until those games end.
+
+        :return:
+        """
+        game_pks = [game_pk for game_pk in self.game_pks if game_pk not in self.focus]
+        while len(game_pks) > 0:
+            try:
+                slate = await self.api_async.call(self.scoreboard_data.refresh_slate, self.game_date)
+                stale = self.api.stale_since(self.api.API_SCHEDULE_SLATE_URL.format(self.game_date)) is not None
+                for game_pk in game_pks:
+                    if game_pk not in slate:
+                        continue
+                    tile = build_tile(slate[game_pk])
+                    if stale:
+                        tile[-1] += ' (stale)'
+                    self.tile_status[game_pk] = slate[game_pk]['gameData']['status']['detailedState']
+                    self.update_tile(game_pk, tile)
+            except (mlb_api.MLBAPIError, KeyError, TypeError):
+                # keep the last tiles, marked, and try again next time
+                for game_pk in game_pks:
+                    tile = list(self.tiles[game_pk])
+                    if not tile[-1].endswith(' (no data)'):
+                        tile[-1] += ' (no data)'
+                    self.update_tile(game_pk, tile)
+
+            # ended games drop out of the slate's poll
+            game_pks = [game_pk for game_pk in game_pks
+                        if self.tile_status[game_pk].upper() not in GAME_STATUS_ENDED and
+                        self.tile_status[game_pk].upper()[:9] not in GAME_STATUS_ENDED]
+            if len(game_pks) == 0:
+                return
+            if any(self.tile_status[game_pk].upper() in GAME_STATUS_RUNNING for game_pk in game_pks):
+                await asyncio.sleep(self.refresh_rate)
+            else:
+                await asyncio.sleep(self.delay_refresh_rate)
+
+    def build_grid(self):
+        """
+        Return the screen lines of the grid, tiles laid out left to right in
+        rows of self.columns.
+
+        :return:
+        """
+        width = max([len(line) for tile in self.tiles.values() for line in tile] + [0])
+        lines = ['MLB games on {} ({} games), updated {}'.format(self.game_date, len(self.game_pks),
+                                                              datetime.datetime.now().strftime('%X')),
+                 '']
+        for row_start in range(0, len(self.game_pks), self.columns):
+            row_tiles = [self.tiles[game_pk] for game_pk in self.game_pks[row_start:row_start + self.columns]]
+            for i in range(max(len(tile) for tile in row_tiles)):
+                lines.append('   '.join('{:<{}}'.format(tile[i] if i < len(tile) else '', width)
+                                        for tile in row_tiles).rstrip())
+            lines.append('')
+        lines.append(self.banner)
+        return lines
+
+    async def draw(self, tasks):
+        # redraw when a tile has changed, until every game is over
+        drawn_version = -1
+        while True:
+            if self.version != drawn_version:
+                drawn_version = self.version
+                self.renderer.render(self.build_grid())
+            if all(task.done() for task in tasks):
+                return
+            await asyncio.sleep(1)
+
+    async def run_async(self):
+        if config.SB_CONFIG.get('grid_poll', 'slate') == 'slate':
+            tasks = [asyncio.create_task(self.refresh_slate_tiles())]
+            tasks += [asyncio.create_task(self.refresh_tile(game_pk)) for game_pk in self.game_pks
+                      if game_pk in self.focus]
+        else:
+            tasks = [asyncio.create_task(self.refresh_tile(game_pk)) for game_pk in self.game_pks]
+        await self.draw(tasks)
+
+    def run(self):
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            print('Exit MLB Live Scoreboard')
+        finally:
+            self.api_async.close()
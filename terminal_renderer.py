@@ -0,0 +1,88 @@
+import os
+import sys
+
+"""
+Redraw a text frame in place on an ANSI terminal.
+
+The renderer keeps the last frame it drew as a list of lines.  Each new
+frame is compared line by line and only the lines that changed are rewritten,
+by moving the cursor to them, so an unchanged scoreboard costs a few bytes
+instead of a screenful, and nothing scrolls or flickers.  The whole frame
+goes out in one write.
+
+Output that isn't a terminal (a pipe or file) gets every frame in full,
+separated by blank lines as the scoreboard always did.
+"""
+
+CSI = '\x1b['
+
+
+class TerminalRenderer:
+    stream = None
+    ansi = False
+    lines = None
+    bytes_written = 0
+
+    def __init__(self, stream=None, ansi=None):
+        self.stream = stream if stream is not None else sys.stdout
+        if ansi is None:
+            ansi = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        self.ansi = ansi
+
+        # Windows 10 consoles only honor escape codes after this
+        if self.ansi and os.name.upper() == 'NT':
+            os.system('')
+
+    def reset(self):
+        """
+        Forget the last frame, so the next one is drawn on a cleared screen.
+        Call after anything else has written to the terminal.
+
+        :return:
+        """
+        self.lines = None
+
+    def build_output(self, lines):
+        """
+        Return the text that turns the last frame into lines.
+
+        :param lines: the new frame, one string per screen line
+        :return:
+        """
+        if not self.ansi:
+            return '\n\n\n\n' + ''.join(line + '\n' for line in lines)
+
+        if self.lines is None:
+            # home, clear screen and draw everything
+            return CSI + 'H' + CSI + '2J' + ''.join(line + CSI + 'K\n' for line in lines)
+
+        output = []
+        for row in range(max(len(lines), len(self.lines))):
+            line = lines[row] if row < len(lines) else ''
+            old_line = self.lines[row] if row < len(self.lines) else None
+            if line != old_line:
+                output.append('{}{};1H{}{}K'.format(CSI, row + 1, line, CSI))
+
+        if len(output) > 0:
+            # leave the cursor under the frame
+            output.append('{}{};1H'.format(CSI, len(lines) + 1))
+        return ''.join(output)
+
+    def render(self, lines):
+        """
+        Draw a frame with a single write and return the number of characters
+        written.
+
+        :param lines: strings to draw one under the other; a string with
+                      newlines takes several screen lines
+        :return:
+        """
+        lines = '\n'.join(str(line) for line in lines).split('\n')
+        output = self.build_output(lines)
+        if len(output) > 0:
+            self.stream.write(output)
+            self.stream.flush()
+
+        self.lines = lines
+        self.bytes_written += len(output)
+        return len(output)
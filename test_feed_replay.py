@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+import feed_replay
+import mlb_api
+
+"""
+Tests of recording MLB responses and answering from the recording.
+
+  >python -m unittest test_feed_replay
+"""
+
+
+class ReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.log_file = tempfile.mkstemp(suffix='.log.gz')
+        os.close(handle)
+        os.remove(self.log_file)
+        self.addCleanup(lambda: os.path.exists(self.log_file) and os.remove(self.log_file))
+
+        recorder = feed_replay.FeedRecorder(self.log_file)
+        recorder.record(mlb_api.MLB_API.API_TEAMS_URL, {'teams': [{'id': 147}]})
+        recorder.record(mlb_api.MLB_API.API_LIVEFEED_URL.format(1), {'metaData': {'timeStamp': '1'}})
+        recorder.close()
+
+        self.api = feed_replay.MLB_API_Replay(self.log_file, feed_replay.ReplayClock(0, speed=0))
+
+    def test_recorded_responses_are_replayed(self):
+        self.assertEqual(self.api.fetch_teams_data(), [{'id': 147}])
+        self.assertEqual(self.api.fetch_live_feed_data(1), {'metaData': {'timeStamp': '1'}})
+        self.assertEqual(self.api.game_pks(), [1])
+
+    def test_missing_recording_is_a_fetch_error(self):
+        with self.assertRaises(mlb_api.MLBAPIError):
+            self.api.fetch_schedule_data('07/04/2024')
+        with self.assertRaises(mlb_api.MLBAPIError):
+            self.api.fetch_live_feed_data(2)
+
+    def test_inherited_state_is_set_up(self):
+        self.assertIsNone(self.api.stale_since(mlb_api.MLB_API.API_LIVEFEED_URL.format(1)))
+        self.assertEqual(self.api.last_good, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
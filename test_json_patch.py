@@ -0,0 +1,122 @@
+import unittest
+
+import json_patch
+
+"""
+Tests of the JSON patch operations the incremental live feed refresh applies.
+
+  >python -m unittest test_json_patch
+"""
+
+
+class ApplyPatchTest(unittest.TestCase):
+
+    def test_add_to_object(self):
+        doc = {'a': {}}
+        json_patch.apply_patch(doc, [{'op': 'add', 'path': '/a/b', 'value': 1}])
+        self.assertEqual(doc, {'a': {'b': 1}})
+
+    def test_add_replaces_existing_key(self):
+        doc = {'a': 1}
+        json_patch.apply_patch(doc, [{'op': 'add', 'path': '/a', 'value': 2}])
+        self.assertEqual(doc, {'a': 2})
+
+    def test_add_inserts_at_list_index(self):
+        doc = {'a': [1, 3]}
+        json_patch.apply_patch(doc, [{'op': 'add', 'path': '/a/1', 'value': 2}])
+        self.assertEqual(doc, {'a': [1, 2, 3]})
+
+    def test_add_at_list_end(self):
+        doc = {'a': [1]}
+        json_patch.apply_patch(doc, [{'op': 'add', 'path': '/a/1', 'value': 2},
+                                     {'op': 'add', 'path': '/a/-', 'value': 3}])
+        self.assertEqual(doc, {'a': [1, 2, 3]})
+
+    def test_add_past_list_end_fails(self):
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({'a': [1]}, [{'op': 'add', 'path': '/a/2', 'value': 2}])
+
+    def test_remove_from_object_and_list(self):
+        doc = {'a': [1, 2, 3], 'b': 1}
+        json_patch.apply_patch(doc, [{'op': 'remove', 'path': '/a/1'},
+                                     {'op': 'remove', 'path': '/b'}])
+        self.assertEqual(doc, {'a': [1, 3]})
+
+    def test_remove_missing_fails(self):
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({'a': [1]}, [{'op': 'remove', 'path': '/a/1'}])
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({'a': 1}, [{'op': 'remove', 'path': '/b'}])
+
+    def test_remove_list_end_fails(self):
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({'a': [1]}, [{'op': 'remove', 'path': '/a/-'}])
+
+    def test_replace_in_object_and_list(self):
+        doc = {'a': [1, 2], 'b': 1}
+        json_patch.apply_patch(doc, [{'op': 'replace', 'path': '/a/0', 'value': 5},
+                                     {'op': 'replace', 'path': '/b', 'value': 2}])
+        self.assertEqual(doc, {'a': [5, 2], 'b': 2})
+
+    def test_replace_missing_fails(self):
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({'a': 1}, [{'op': 'replace', 'path': '/b', 'value': 2}])
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({'a': [1]}, [{'op': 'replace', 'path': '/a/1', 'value': 2}])
+
+    def test_invalid_list_index_fails(self):
+        for token in ['x', '01', '-1']:
+            with self.assertRaises(json_patch.JsonPatchError):
+                json_patch.apply_patch({'a': [1]}, [{'op': 'replace', 'path': '/a/' + token, 'value': 2}])
+
+    def test_move_and_copy(self):
+        doc = {'a': {'x': [1]}, 'b': {}}
+        json_patch.apply_patch(doc, [{'op': 'copy', 'from': '/a/x', 'path': '/b/y'},
+                                     {'op': 'move', 'from': '/a/x', 'path': '/b/x'}])
+        self.assertEqual(doc, {'a': {}, 'b': {'x': [1], 'y': [1]}})
+        doc['b']['x'].append(2)
+        self.assertEqual(doc['b']['y'], [1])
+
+    def test_test_operation(self):
+        json_patch.apply_patch({'a': 1}, [{'op': 'test', 'path': '/a', 'value': 1}])
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({'a': 1}, [{'op': 'test', 'path': '/a', 'value': 2}])
+
+    def test_escaped_pointer(self):
+        doc = {'a/b': {}, 'c~d': 1}
+        json_patch.apply_patch(doc, [{'op': 'add', 'path': '/a~1b/x', 'value': 1},
+                                     {'op': 'remove', 'path': '/c~0d'}])
+        self.assertEqual(doc, {'a/b': {'x': 1}})
+
+    def test_path_through_missing_key_fails(self):
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({}, [{'op': 'add', 'path': '/a/b', 'value': 1}])
+
+    def test_root_and_bad_pointers_fail(self):
+        for path in ['', 'a']:
+            with self.assertRaises(json_patch.JsonPatchError):
+                json_patch.apply_patch({}, [{'op': 'add', 'path': path, 'value': 1}])
+
+    def test_malformed_and_unknown_operations_fail(self):
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({}, [{'op': 'add', 'path': '/a'}])
+        with self.assertRaises(json_patch.JsonPatchError):
+            json_patch.apply_patch({}, [{'op': 'merge', 'path': '/a', 'value': 1}])
+
+    def test_values_are_not_shared_between_documents(self):
+        # a coalesced patch list is applied to every viewer's feed
+        patch = [{'op': 'add', 'path': '/play', 'value': {'playEvents': []}}]
+        doc1 = json_patch.apply_patch({}, patch)
+        doc2 = json_patch.apply_patch({}, patch)
+
+        append = [{'op': 'add', 'path': '/play/playEvents/-', 'value': {'pitchNumber': 1}}]
+        json_patch.apply_patch(doc1, append)
+        json_patch.apply_patch(doc2, append)
+
+        self.assertEqual(doc1['play']['playEvents'], [{'pitchNumber': 1}])
+        self.assertEqual(doc2['play']['playEvents'], [{'pitchNumber': 1}])
+        self.assertEqual(patch[0]['value'], {'playEvents': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
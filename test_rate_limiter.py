@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+import rate_limiter
+
+"""
+Tests of the host-wide token bucket rate limiter.
+
+  >python -m unittest test_rate_limiter
+"""
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def new_limiter(self, rates, reserve=0.2):
+        handle, state_file = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        self.addCleanup(os.remove, state_file)
+        return rate_limiter.RateLimiter(rates, reserve, state_file)
+
+    @staticmethod
+    def acquired(limiter, endpoint, priority, requests):
+        # how many of requests taken back to back get a token
+        return len([i for i in range(requests) if limiter.try_acquire(endpoint, priority) == 0])
+
+    def test_live_feed_gets_through_saturated_low_traffic(self):
+        limiter = self.new_limiter({'total': 10, 'live_feed': 10, 'schedule': 100, 'default': 2})
+
+        # low priority traffic gets the total less the reserve ...
+        self.assertEqual(self.acquired(limiter, 'schedule', rate_limiter.LOW, 20), 8)
+        self.assertGreater(limiter.try_acquire('schedule', rate_limiter.LOW), 0)
+
+        # ... and live feed polls still get the reserve
+        self.assertEqual(self.acquired(limiter, 'live_feed', rate_limiter.HIGH, 2), 2)
+        self.assertGreater(limiter.try_acquire('live_feed', rate_limiter.HIGH), 0)
+
+    def test_live_feed_can_use_the_whole_total(self):
+        limiter = self.new_limiter({'total': 10, 'live_feed': 20, 'default': 2})
+
+        self.assertEqual(self.acquired(limiter, 'live_feed', rate_limiter.HIGH, 20), 10)
+
+    def test_low_total_rate_still_grants_low_priority(self):
+        # low priority requests still get the total less the reserve at a total of 1/s
+        limiter = self.new_limiter({'total': 1, 'schedule': 2, 'teams': 1, 'default': 2})
+
+        self.assertEqual(limiter.try_acquire('teams', rate_limiter.LOW), 0)
+        wait = limiter.try_acquire('schedule', rate_limiter.LOW)
+        self.assertGreater(wait, 0)
+        self.assertLessEqual(wait, 1 / 0.8)
+
+    def test_none_rates_are_unlimited(self):
+        limiter = self.new_limiter({'total': None, 'teams': None, 'default': 2})
+
+        self.assertEqual(self.acquired(limiter, 'teams', rate_limiter.LOW, 50), 50)
+
+    def test_reserve_must_leave_a_share(self):
+        with self.assertRaises(ValueError):
+            rate_limiter.RateLimiter({'total': 10}, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
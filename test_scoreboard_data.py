@@ -0,0 +1,257 @@
+import copy
+import io
+import json
+import unittest
+import unittest.mock
+
+import config
+import feed_stream
+import game_events
+import mlb_api
+import scoreboard_data
+
+"""
+Tests of the play log ScoreboardData keeps from the live feed, run against a
+made-up game served by FakeAPI instead of MLB.
+
+  >python -m unittest test_scoreboard_data
+"""
+
+GAME_PK = 1
+
+TEAMS = [{'id': 147, 'name': 'New York Yankees', 'abbreviation': 'NYY', 'teamName': 'Yankees'},
+         {'id': 111, 'name': 'Boston Red Sox', 'abbreviation': 'BOS', 'teamName': 'Red Sox'}]
+
+AWAY_BATTERS = [101, 102, 103, 104, 105, 106, 107, 108, 109]
+HOME_BATTERS = [201, 202, 203, 204, 205, 206, 207, 208, 209]
+AWAY_PITCHER = 110
+HOME_PITCHER = 210
+
+PITCHES = [('Ball', 'Four-Seam Fastball'), ('Called Strike', 'Slider'), ('Foul', 'Changeup'),
+           ('Swinging Strike', 'Curveball'), ('Ball', 'Sinker')]
+
+
+def build_players(batters, pitcher):
+    players = {}
+    for slot, player_id in enumerate(batters + [pitcher]):
+        player = {'person': {'id': player_id, 'fullName': 'Player {}'.format(player_id)},
+                  'jerseyNumber': str(slot + 1),
+                  'stats': {'batting': {'hits': 0, 'atBats': 0}},
+                  'seasonStats': {'batting': {'avg': '.250'},
+                                  'pitching': {'era': '3.00', 'wins': 1, 'losses': 1}}}
+        if player_id != pitcher:
+            player['battingOrder'] = str((slot + 1) * 100)
+        players['ID{}'.format(player_id)] = player
+    return players
+
+
+def build_play(at_bat_index, pitches, is_complete):
+    """
+    Return an allPlays entry of the home pitcher facing the away lineup, with
+    every field of the full feed the tests compare.
+
+    :param at_bat_index:
+    :param pitches: number of pitches thrown so far
+    :param is_complete:
+    :return:
+    """
+    batter_id = AWAY_BATTERS[at_bat_index % 9]
+    play_events = []
+    for i in range(pitches):
+        description, pitch_type = PITCHES[i % len(PITCHES)]
+        play_events.append({'index': i,
+                            'isPitch': True,
+                            'pitchNumber': i + 1,
+                            'type': 'pitch',
+                            'details': {'description': description,
+                                        'code': description[0],
+                                        'type': {'code': pitch_type[:2], 'description': pitch_type}},
+                            'pitchData': {'startSpeed': 90.0 + i, 'endSpeed': 82.0 + i}})
+
+    play = {'atBatIndex': at_bat_index,
+            'result': {},
+            'about': {'atBatIndex': at_bat_index, 'inning': 1, 'halfInning': 'top', 'isComplete': is_complete,
+                      'isScoringPlay': False},
+            'count': {'balls': 0, 'strikes': 0, 'outs': at_bat_index},
+            'matchup': {'batter': {'id': batter_id, 'fullName': 'Player {}'.format(batter_id)},
+                        'pitcher': {'id': HOME_PITCHER, 'fullName': 'Player {}'.format(HOME_PITCHER)}},
+            'playEvents': play_events}
+    if is_complete:
+        play['result'] = {'type': 'atBat', 'event': 'Groundout',
+                          'description': 'Player {} grounds out.'.format(batter_id)}
+    return play
+
+
+def build_feed(time_stamp, plays):
+    """
+    Return a full live feed of an inning in progress.
+
+    :param time_stamp: metaData.timeStamp
+    :param plays: allPlays, the last one is the current play
+    :return:
+    """
+    return {'metaData': {'timeStamp': time_stamp, 'gameEvents': [], 'logicalEvents': []},
+            'gameData': {'status': {'detailedState': 'In Progress', 'abstractGameState': 'Live'},
+                         'datetime': {'originalDate': '2024-07-04', 'time': '7:05', 'ampm': 'PM'},
+                         'teams': {'away': {'id': 147, 'abbreviation': 'NYY', 'record': {'wins': 1, 'losses': 0}},
+                                   'home': {'id': 111, 'abbreviation': 'BOS', 'record': {'wins': 0, 'losses': 1}}},
+                         'probablePitchers': {}},
+            'liveData': {'linescore': {'currentInning': 1,
+                                       'inningHalf': 'Top',
+                                       'inningState': 'Top',
+                                       'innings': [{'num': 1, 'away': {'runs': 0}, 'home': {}}],
+                                       'teams': {'away': {'runs': 0, 'hits': 0, 'errors': 0},
+                                                 'home': {'runs': 0, 'hits': 0, 'errors': 0}},
+                                       'offense': {}},
+                         'plays': {'allPlays': plays,
+                                   'currentPlay': copy.deepcopy(plays[-1]),
+                                   'playsByInning': [{'top': list(range(len(plays))), 'bottom': []}]},
+                         'boxscore': {'teams': {'away': {'team': {'id': 147},
+                                                         'battingOrder': list(AWAY_BATTERS),
+                                                         'players': build_players(AWAY_BATTERS, AWAY_PITCHER)},
+                                                'home': {'team': {'id': 111},
+                                                         'battingOrder': list(HOME_BATTERS),
+                                                         'players': build_players(HOME_BATTERS, HOME_PITCHER)}}},
+                         'decisions': {}}}
+
+
+class FakeResponse:
+    status_code = 200
+    ok = True
+
+    def __init__(self, data):
+        self.content = json.dumps(data).encode('utf-8')
+        self.headers = {}
+
+    def close(self):
+        pass
+
+
+class FakeAPI(mlb_api.MLB_API):
+    """
+    MLB_API answering from feed instead of the network.  A fields= request
+    gets the feed pruned to the projection, and every request fails while
+    down is set.
+    """
+
+    feed = None
+    down = False
+
+    def request(self, url, headers=None, stream=False):
+        if self.down:
+            raise mlb_api.MLBAPIError('MLB is down')
+        if '/teams' in url:
+            return FakeResponse({'teams': TEAMS})
+        if 'fields=' in url:
+            return FakeResponse(feed_stream.prune(self.feed, feed_stream.build_path_tree(
+                self.FEED_PROJECTIONS['scoreboard'])))
+        return FakeResponse(self.feed)
+
+
+class PlayLogTestCase(unittest.TestCase):
+
+    def setUp(self):
+        patches = [unittest.mock.patch.dict(config.SB_CONFIG, {'live_feed': 'full',
+                                                                'db_file': ':memory:',
+                                                                'persist_status': False}),
+                   unittest.mock.patch.dict(config.API_CONFIG, {'rate_limits': None,
+                                                                 'cache_file': None,
+                                                                 'retries': 0}),
+                   unittest.mock.patch.object(mlb_api._single_flight, 'window', 0)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.follow_game('full')
+
+    def follow_game(self, live_feed):
+        """
+        Start following the game from a new FakeAPI in live_feed mode,
+        collecting every published event in self.events.
+
+        :param live_feed:
+        :return:
+        """
+        config.SB_CONFIG['live_feed'] = live_feed
+        self.api = FakeAPI()
+        self.sb_data = scoreboard_data.ScoreboardData(self.api)
+        self.events = []
+        self.sb_data.subscribe(self.events.append)
+
+    def refresh(self, feed):
+        """
+        Refresh from feed and fail the test on the data error that
+        refresh_live_data only prints.
+
+        :param feed:
+        :return:
+        """
+        self.api.feed = feed
+        with unittest.mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.sb_data.refresh_live_data(GAME_PK)
+        self.assertNotIn('A data error occurred', stdout.getvalue())
+
+    def pitch_events(self):
+        return [(event.at_bat_index, event.pitch_number, event.description, event.pitch_type, event.pitch_count)
+                for event in self.events if isinstance(event, game_events.NewPitch)]
+
+
+class ProjectedPlayLogTest(PlayLogTestCase):
+
+    def play_log_for(self, live_feed):
+        """
+        Follow an at-bat pitch by pitch in live_feed mode and return the pitch
+        events, the last logged play and the pitcher's count.
+
+        :param live_feed:
+        :return:
+        """
+        self.follow_game(live_feed)
+        self.refresh(build_feed('1', [build_play(0, 3, True), build_play(1, 1, False)]))
+        self.refresh(build_feed('2', [build_play(0, 3, True), build_play(1, 3, False)]))
+        self.refresh(build_feed('3', [build_play(0, 3, True), build_play(1, 5, True), build_play(2, 1, False)]))
+        return self.pitch_events(), self.sb_data.return_last_logged_play(), self.sb_data.return_pitch_count(HOME_PITCHER)
+
+    def test_projected_play_log_matches_full_feed(self):
+        full = self.play_log_for('full')
+        projected = self.play_log_for('projected')
+
+        self.assertEqual(projected, full)
+        self.assertEqual(full[0][0], (1, 2, 'Called Strike', 'Slider', 5))
+        self.assertEqual(full[2], 9)
+
+    def test_streamed_play_log_matches_full_feed(self):
+        if feed_stream.ijson is None:
+            self.skipTest('streamed mode needs ijson')
+        self.assertEqual(self.play_log_for('streamed'), self.play_log_for('full'))
+
+
+class StaleFeedPlayLogTest(PlayLogTestCase):
+
+    def test_recovery_after_stale_feed_logs_each_pitch_once(self):
+        self.refresh(build_feed('1', [build_play(0, 1, False)]))
+        self.refresh(build_feed('2', [build_play(0, 2, False)]))
+        self.assertEqual(self.pitch_events(), [(0, 2, 'Called Strike', 'Slider', 2)])
+
+        # MLB goes down and the last good feed is served
+        self.api.down = True
+        self.refresh(build_feed('2', [build_play(0, 2, False)]))
+        self.assertIsNotNone(self.sb_data.return_stale_since())
+
+        self.api.down = False
+        self.refresh(build_feed('3', [build_play(0, 3, False)]))
+        self.assertIsNone(self.sb_data.return_stale_since())
+        self.assertEqual(self.pitch_events(), [(0, 2, 'Called Strike', 'Slider', 2),
+                                               (0, 3, 'Foul', 'Changeup', 3)])
+        self.assertEqual(self.sb_data.return_pitch_count(HOME_PITCHER), 3)
+
+    def test_feed_with_fewer_events_does_not_move_the_cursor_back(self):
+        self.refresh(build_feed('1', [build_play(0, 2, False)]))
+        self.refresh(build_feed('2', [build_play(0, 0, False)]))
+        self.refresh(build_feed('3', [build_play(0, 3, False)]))
+
+        self.assertEqual(self.pitch_events(), [(0, 3, 'Foul', 'Changeup', 3)])
+        self.assertEqual(self.sb_data.return_pitch_count(HOME_PITCHER), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+
+import scoreboard_grid
+from test_scoreboard_data import GAME_PK, HOME_PITCHER, PlayLogTestCase, build_feed, build_play
+
+"""
+Tests of the focus game tiles of the grid.
+
+  >python -m unittest test_scoreboard_grid
+"""
+
+
+class FocusTileTest(PlayLogTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.grid = scoreboard_grid.ScoreboardGrid(self.api, sb_data=self.sb_data, focus=[GAME_PK])
+        self.addCleanup(self.grid.api_async.close)
+        self.grid.game_pks = [GAME_PK]
+        self.grid.tiles[GAME_PK] = [''] * 4
+
+    def test_focus_lines_come_from_the_play_log(self):
+        feed = build_feed('1', [build_play(0, 3, True), build_play(1, 2, False)])
+        play_log = self.grid.focus_data[GAME_PK]
+        play_log.log_live_data(GAME_PK, feed)
+
+        lines = scoreboard_grid.build_focus_lines(feed, play_log, 60)
+        self.assertEqual(lines, ['Count 0-0, bases empty',
+                                 '102 vs. {} (5 pitches)'.format(HOME_PITCHER),
+                                 'Last: Player 101 grounds out.'])
+
+    def test_no_matchup_before_the_first_pitch(self):
+        feed = build_feed('1', [build_play(0, 3, True), build_play(1, 0, False)])
+        del feed['liveData']['plays']['currentPlay']['matchup']
+        play_log = self.grid.focus_data[GAME_PK]
+        play_log.log_live_data(GAME_PK, feed)
+
+        lines = scoreboard_grid.build_focus_lines(feed, play_log, 60)
+        self.assertEqual(lines, ['Count 0-0, bases empty', 'Last: Player 101 grounds out.'])
+
+    def test_focus_tile_of_a_finished_game(self):
+        # a finished game is refreshed once and its task ends
+        self.api.feed = build_feed('1', [build_play(0, 3, True)])
+        self.api.feed['gameData']['status']['detailedState'] = 'Final'
+        self.api.feed['liveData']['decisions'] = {'winner': {'fullName': 'Player 110'},
+                                                  'loser': {'fullName': 'Player 210'}}
+        asyncio.run(self.grid.refresh_tile(GAME_PK))
+
+        tile = self.grid.tiles[GAME_PK]
+        self.assertEqual(tile[scoreboard_grid.TILE_STATUS_LINE], 'Final')
+        self.assertEqual(tile[-1], 'W: 110  L: 210')
+
+
+if __name__ == '__main__':
+    unittest.main()